@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtGui import QPixmapCache
 
 from src.views.main_window import MainWindow
 from src.utils.logger import Logger
@@ -31,6 +32,10 @@ def main():
 
         # Initialiser l'application Qt
         app = QApplication(sys.argv)
+
+        # Budget du cache des images mises à l'échelle pour l'affichage (en Ko)
+        QPixmapCache.setCacheLimit(256 * 1024)
+
         window = MainWindow(controller_manager=controller_manager)
         window.show()
 
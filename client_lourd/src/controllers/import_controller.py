@@ -1,6 +1,8 @@
 # src/controllers/import_controller.py
 
 import json
+import os
+import stat
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 
@@ -497,13 +499,41 @@ class ImportController:
         Returns:
             True si l'import a réussi
         """
+        image = self.create_local_image(image_path)
+        if image is None:
+            return False
+        
+        return self.add_images_to_dataset(dataset, [image]) == 1
+    
+    def create_local_image(
+        self,
+        image_path: Union[str, Path],
+        file_stat: Optional[os.stat_result] = None
+    ) -> Optional[Image]:
+        """
+        Crée l'objet Image d'un fichier local, sans modifier aucun dataset.
+        
+        Ne touche ni au dataset ni à la base de données: peut être appelée
+        depuis plusieurs threads en parallèle.
+        
+        Args:
+            image_path: Chemin vers l'image
+            file_stat: Résultat de os.stat déjà obtenu pour ce fichier (évite de le relire)
+            
+        Returns:
+            Image créée, ou None si le fichier est invalide
+        """
         try:
             path = Path(image_path)
             
             # Vérifier que le fichier existe
-            if not path.exists() or not path.is_file():
+            if file_stat is not None:
+                is_file = stat.S_ISREG(file_stat.st_mode)
+            else:
+                is_file = path.is_file()
+            if not is_file:
                 self.logger.warning(f"Fichier introuvable: {path}")
-                return False
+                return None
             
             # Vérifier l'extension du fichier
             config = self.config_manager.get_config() if hasattr(self, 'config_manager') else None
@@ -511,7 +541,7 @@ class ImportController:
             
             if path.suffix.lower()[1:] not in supported_formats:
                 self.logger.warning(f"Format non supporté: {path.suffix}")
-                return False
+                return None
             
             # Créer un identifiant unique pour l'image
             import uuid
@@ -524,13 +554,12 @@ class ImportController:
                     width, height = pil_img.size
             except Exception as e:
                 self.logger.error(f"Impossible de lire l'image {path}: {str(e)}")
-                return False
+                return None
             
             # Créer un objet Image
-            from src.models.image import Image
             from src.models.enums import ImageSource
             
-            image = Image(
+            return Image(
                 id=image_id,
                 path=path,
                 width=width,
@@ -539,19 +568,39 @@ class ImportController:
                 metadata={"original_filename": path.name}
             )
             
-            # Ajouter l'image au dataset
-            dataset.add_image(image)
+        except Exception as e:
+            self.logger.error(f"Échec de l'import de l'image {image_path}: {str(e)}")
+            return None
+    
+    def add_images_to_dataset(self, dataset, images: List[Image]) -> int:
+        """
+        Ajoute des images déjà créées à un dataset et le sauvegarde une seule fois.
+        
+        Args:
+            dataset: Dataset de destination
+            images: Images à ajouter
+            
+        Returns:
+            Nombre d'images ajoutées
+        """
+        if not images:
+            return 0
+        
+        try:
+            for image in images:
+                dataset.add_image(image)
             
             # Si possible, sauvegarder le dataset
             if hasattr(self, 'dataset_service') and hasattr(self.dataset_service, 'update_dataset'):
                 self.dataset_service.update_dataset(dataset)
             
-            self.logger.info(f"Image importée avec succès: {path}")
-            return True
+            for image in images:
+                self.logger.info(f"Image importée avec succès: {image.path}")
+            return len(images)
             
         except Exception as e:
-            self.logger.error(f"Échec de l'import de l'image {image_path}: {str(e)}")
-            return False
+            self.logger.error(f"Échec de l'ajout des images au dataset: {str(e)}")
+            return 0
         
     def import_yolo_dataset(
         self, 
@@ -218,6 +218,7 @@ class TranslationManager(QObject):
             "view.dashboard.success": "Succès",
             "view.dashboard.dataset_deleted": "Dataset '{0}' supprimé avec succès",
             "view.dashboard.delete_error": "Erreur lors de la suppression: {0}",
+            "view.dashboard.dataset_item": "{0} - {1} images, {2} annotations",
             
             # Composants
             "component.image_viewer.class_label": "Classe",
@@ -469,6 +470,7 @@ class TranslationManager(QObject):
             "view.dashboard.success": "Success",
             "view.dashboard.dataset_deleted": "Dataset '{0}' deleted successfully",
             "view.dashboard.delete_error": "Error during deletion: {0}",
+            "view.dashboard.dataset_item": "{0} - {1} images, {2} annotations",
             
             # Composants
             "component.image_viewer.class_label": "Class",
@@ -188,6 +188,21 @@ class Logger(metaclass=LoggerSingleton):
         """Log un message de débogage."""
         self.get_logger(module).debug(message)
     
+    def is_debug_enabled(self, module: str = None) -> bool:
+        """
+        Indique si les messages de débogage sont émis.
+        
+        Permet de ne pas construire des messages qui seraient ignorés,
+        dans les boucles et les chemins fréquents.
+        
+        Args:
+            module: Nom du module (optionnel)
+            
+        Returns:
+            True si le niveau DEBUG est actif
+        """
+        return self.get_logger(module).isEnabledFor(logging.DEBUG)
+    
     def info(self, message: str, module: str = None):
         """Log un message d'information."""
         self.get_logger(module).info(message)
@@ -0,0 +1,166 @@
+# src/utils/thumbnail_cache.py
+
+from typing import Optional
+from pathlib import Path
+import hashlib
+import os
+import threading
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QImage
+
+from src.utils.logger import Logger
+
+class ThumbnailCache:
+    """
+    Cache disque des miniatures d'images.
+
+    Les miniatures sont stockées en PNG, sous une clé dérivée du chemin, de la date
+    de modification et de la taille du fichier source: une image modifiée produit
+    une nouvelle clé et n'est jamais servie périmée. Les méthodes sont appelées
+    depuis les tâches de fond et ne manipulent donc que des QImage.
+    """
+
+    # Nombre d'écritures entre deux purges du cache
+    PRUNE_INTERVAL = 256
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_mb: int = 500,
+        logger: Optional[Logger] = None
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            cache_dir: Répertoire de cache
+            max_size_mb: Taille maximale du cache en Mo
+            logger: Gestionnaire de logs
+        """
+        self.cache_dir = cache_dir or Path("data/cache/thumbnails")
+        self.max_size = max_size_mb * 1024 * 1024
+        self.logger = logger or Logger()
+
+        # Créer le répertoire de cache s'il n'existe pas
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Mutex pour éviter les conflits d'accès entre tâches
+        self._lock = threading.RLock()
+        self._writes = 0
+
+    def get(self, path: str, size: QSize) -> Optional[QImage]:
+        """
+        Récupère la miniature d'une image.
+
+        Args:
+            path: Chemin de l'image source
+            size: Taille de la miniature
+
+        Returns:
+            Miniature ou None si absente du cache
+        """
+        cache_file = self._get_cache_path(path, size)
+        if cache_file is None or not cache_file.exists():
+            return None
+
+        image = QImage(str(cache_file))
+        if image.isNull():
+            return None
+
+        # Marquer l'entrée comme récemment utilisée pour la purge
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return image
+
+    def put(self, path: str, size: QSize, image: QImage) -> bool:
+        """
+        Stocke la miniature d'une image.
+
+        Args:
+            path: Chemin de l'image source
+            size: Taille de la miniature
+            image: Miniature à stocker
+
+        Returns:
+            True si l'opération a réussi
+        """
+        cache_file = self._get_cache_path(path, size)
+        if cache_file is None:
+            return False
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(cache_file), "PNG"):
+                return False
+        except Exception as e:
+            self.logger.debug(f"Erreur d'écriture de la miniature de '{path}': {str(e)}")
+            return False
+
+        with self._lock:
+            self._writes += 1
+            if self._writes % self.PRUNE_INTERVAL == 0:
+                self.prune()
+        return True
+
+    def prune(self) -> int:
+        """
+        Supprime les miniatures les moins récemment utilisées au-delà de la taille maximale.
+
+        Returns:
+            Nombre de fichiers supprimés
+        """
+        with self._lock:
+            try:
+                entries = []
+                total_size = 0
+                for cache_file in self.cache_dir.glob("*/*.png"):
+                    try:
+                        stat = cache_file.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, cache_file))
+                    total_size += stat.st_size
+
+                count = 0
+                if total_size > self.max_size:
+                    entries.sort()
+                    for _, file_size, cache_file in entries:
+                        if total_size <= self.max_size:
+                            break
+                        try:
+                            cache_file.unlink()
+                            total_size -= file_size
+                            count += 1
+                        except OSError:
+                            pass
+
+                    self.logger.info(f"Cache des miniatures purgé: {count} fichiers supprimés")
+                return count
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la purge du cache des miniatures: {str(e)}")
+                return 0
+
+    def _get_cache_path(self, path: str, size: QSize) -> Optional[Path]:
+        """
+        Génère le chemin du fichier de cache pour une image.
+
+        Args:
+            path: Chemin de l'image source
+            size: Taille de la miniature
+
+        Returns:
+            Chemin du fichier, ou None si l'image source est inaccessible
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}:{size.width()}x{size.height()}"
+        hash_key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+        # Utiliser les 2 premiers caractères comme sous-répertoire
+        return self.cache_dir / hash_key[:2] / f"{hash_key}.png"
@@ -17,18 +17,26 @@ from PyQt6.QtWidgets import (
     QWidget,
     QColorDialog,
     QToolButton,
-
+    QLineEdit,
+    QMessageBox,
 )
-from PyQt6.QtGui import QAction
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, QTimer, QSignalBlocker, pyqtSignal
 from PyQt6.QtGui import QColor, QIcon, QPixmap, QPainter, QTransform
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+from collections import deque, namedtuple
+from contextlib import ExitStack, contextmanager
 
 from src.utils.i18n import get_translation_manager, tr
 from src.models import Image, Dataset, Annotation, BoundingBox
 from src.models.enums import AnnotationType
 from src.utils.logger import Logger
 
+# État des champs éditables (tuple nommé: immuable et sans __dict__ par instance)
+EditorState = namedtuple("EditorState", ["class_id", "x", "y", "width", "height", "confidence"])
+
+# Modification d'un champ de l'état de l'éditeur (index dans EditorState)
+FieldDelta = namedtuple("FieldDelta", ["field", "old", "new"])
+
 class AnnotationEditor(QDialog):
     """
     Éditeur avancé pour la création/modification d'annotations.
@@ -39,6 +47,22 @@ class AnnotationEditor(QDialog):
     annotation_edited = pyqtSignal(Annotation)  # Émis quand une annotation est modifiée
     annotation_added = pyqtSignal(Annotation)   # Émis quand une annotation est ajoutée
     
+    # Nombre maximal d'états conservés pour undo/redo
+    MAX_HISTORY = 128
+    
+    # Délai (ms) de regroupement des modifications successives dans l'historique
+    HISTORY_DEBOUNCE_MS = 300
+    
+    # Durée (ms) d'affichage des messages d'état
+    STATUS_MESSAGE_MS = 1500
+    
+    # Décalage (normalisé) appliqué à une annotation dupliquée
+    DUPLICATE_OFFSET = 0.02
+    
+    # Touches et modificateurs résolus une seule fois
+    VALIDATE_KEYS = frozenset((Qt.Key.Key_Return.value, Qt.Key.Key_Enter.value))
+    CTRL_MODIFIER = Qt.KeyboardModifier.ControlModifier
+    
     def __init__(
         self, 
         image: Image,
@@ -72,8 +96,17 @@ class AnnotationEditor(QDialog):
         self.color = QColor(0, 255, 0)  # Couleur par défaut
         self.opacity = 60  # Opacité par défaut (0-100)
         self.highlight_similar = False  # Surligner des annotations similaires
-        self.annotation_history = []  # Historique pour undo/redo
-        self.history_position = -1  # Position actuelle dans l'historique
+        self.annotation_history = None  # Modifications pour undo/redo (créé à la première édition)
+        self.history_position = -1  # Index de la dernière modification appliquée
+        self._current_state = None  # État de référence des modifications
+        self.undo_button = None  # Créés uniquement en mode édition
+        self.redo_button = None
+        
+        # Temporisateur regroupant les modifications rapides en un seul état
+        self._history_timer = QTimer(self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(self.HISTORY_DEBOUNCE_MS)
+        self._history_timer.timeout.connect(self._save_to_history_now)
         
         # Configuration de la fenêtre
         title = tr("component.annotation_editor.edit_title") if self.is_edit_mode else tr("component.annotation_editor.create_title")
@@ -82,12 +115,15 @@ class AnnotationEditor(QDialog):
         
         # Initialiser l'interface
         self._init_ui()
+        self._build_keymap()
         
         # Si une annotation est fournie, remplir les champs
         if annotation:
             self._load_annotation(annotation)
-            # Sauvegarder l'état initial dans l'historique
-            self._save_to_history()
+            # Prendre l'état initial comme référence de l'historique
+            self._reset_history()
+            # Enregistrer les modifications ultérieures dans l'historique
+            self._connect_history_signals()
         
     def _init_ui(self):
         """Initialise l'interface utilisateur."""
@@ -106,10 +142,9 @@ class AnnotationEditor(QDialog):
         
         # Liste déroulante des classes
         self.class_combo = QComboBox()
+        self._class_index_by_id = {}  # class_id -> index dans la liste déroulante
         for class_id, class_name in sorted(self.dataset.classes.items()):
-            self.class_combo.addItem(class_name, class_id)
-        
-        class_layout.addRow(tr("component.annotation_editor.class"), self.class_combo)
+            self._add_class_item(class_id, class_name)
         
         # Créer une nouvelle classe
         new_class_button = QToolButton()
@@ -424,7 +459,7 @@ class AnnotationEditor(QDialog):
         
         self.highlight_similar_check = QCheckBox(tr("component.annotation_editor.highlight_similar"))
         self.highlight_similar_check.setChecked(self.highlight_similar)
-        self.highlight_similar_check.stateChanged.connect(self._toggle_highlight_similar)
+        self.highlight_similar_check.toggled.connect(self._set_highlight_similar)
         
         display_layout.addWidget(self.show_label_check)
         display_layout.addWidget(self.show_confidence_check)
@@ -466,6 +501,15 @@ class AnnotationEditor(QDialog):
             reset_button = QPushButton(tr("component.annotation_editor.reset"))
             reset_button.clicked.connect(self._reset_annotation)
             control_layout.addWidget(reset_button)
+            
+            # Message d'état non bloquant (effacé automatiquement)
+            self.status_label = QLabel()
+            control_layout.addWidget(self.status_label)
+            
+            self._status_timer = QTimer(self)
+            self._status_timer.setSingleShot(True)
+            self._status_timer.setInterval(self.STATUS_MESSAGE_MS)
+            self._status_timer.timeout.connect(self.status_label.clear)
         
         # Boutons standard
         save_button = QPushButton(tr("button.save"))
@@ -480,9 +524,36 @@ class AnnotationEditor(QDialog):
         
         main_layout.addLayout(control_layout)
         
+        # Champs dont les signaux sont bloqués lors d'un chargement/restauration
+        self._state_widgets = (
+            self.class_combo,
+            self.x_spin,
+            self.y_spin,
+            self.width_spin,
+            self.height_spin,
+            self.conf_spin,
+            self.conf_slider
+        )
+        
         # Mettre à jour les labels de pixels
         self._update_pixel_labels()
         
+    def _add_class_item(self, class_id: int, class_name: str) -> int:
+        """
+        Ajoute une classe à la liste déroulante et indexe sa position.
+        
+        Args:
+            class_id: ID de la classe
+            class_name: Nom de la classe
+            
+        Returns:
+            Index de la classe dans la liste déroulante
+        """
+        self.class_combo.addItem(class_name, class_id)
+        index = self.class_combo.count() - 1
+        self._class_index_by_id[class_id] = index
+        return index
+        
     def _update_pixel_labels(self):
         """Met à jour les labels de dimensions en pixels."""
         self.x_pixel_label.setText(f"({int(self.x_spin.value() * self.image.width)}px)")
@@ -497,20 +568,22 @@ class AnnotationEditor(QDialog):
         Args:
             annotation: Annotation à charger
         """
-        # Définir la classe
-        index = self.class_combo.findData(annotation.class_id)
-        if index >= 0:
-            self.class_combo.setCurrentIndex(index)
+        with self._transact():
+            # Définir la classe
+            index = self._class_index_by_id.get(annotation.class_id, -1)
+            if index >= 0:
+                self.class_combo.setCurrentIndex(index)
+                
+            # Définir les coordonnées de la bounding box
+            self.x_spin.setValue(annotation.bbox.x)
+            self.y_spin.setValue(annotation.bbox.y)
+            self.width_spin.setValue(annotation.bbox.width)
+            self.height_spin.setValue(annotation.bbox.height)
             
-        # Définir les coordonnées de la bounding box
-        self.x_spin.setValue(annotation.bbox.x)
-        self.y_spin.setValue(annotation.bbox.y)
-        self.width_spin.setValue(annotation.bbox.width)
-        self.height_spin.setValue(annotation.bbox.height)
-        
-        # Définir la confiance
-        if annotation.confidence is not None:
-            self.conf_spin.setValue(annotation.confidence)
+            # Définir la confiance
+            if annotation.confidence is not None:
+                self.conf_spin.setValue(annotation.confidence)
+                self.conf_slider.setValue(int(annotation.confidence * 100))
             
     def _save_annotation(self):
         """Enregistre l'annotation et ferme l'éditeur."""
@@ -562,7 +635,6 @@ class AnnotationEditor(QDialog):
         except Exception as e:
             self.logger.error(f"Erreur lors de la sauvegarde de l'annotation: {str(e)}")
             # Afficher une erreur à l'utilisateur
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self,
                 tr("component.annotation_editor.error"),
@@ -594,14 +666,14 @@ class AnnotationEditor(QDialog):
         """
         self.opacity = value
         
-    def _toggle_highlight_similar(self, state: int):
+    def _set_highlight_similar(self, checked: bool):
         """
         Active/désactive la mise en évidence des annotations similaires.
         
         Args:
-            state: État de la case à cocher
+            checked: True si la case est cochée
         """
-        self.highlight_similar = state == Qt.CheckState.Checked.value
+        self.highlight_similar = checked
         
     def _apply_transformations(self):
         """Applique les transformations de rotation et redimensionnement à l'annotation."""
@@ -721,8 +793,6 @@ class AnnotationEditor(QDialog):
         
     def _add_new_class(self):
         """Ajoute une nouvelle classe au dataset."""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QSpinBox, QPushButton, QHBoxLayout
-        
         # Créer un dialogue pour ajouter une classe
         dialog = QDialog(self)
         dialog.setWindowTitle(tr("component.annotation_editor.add_class_title"))
@@ -736,9 +806,8 @@ class AnnotationEditor(QDialog):
         class_id_spin.setRange(0, 999)
         
         # Trouver le prochain ID disponible
-        existing_ids = [self.class_combo.itemData(i) for i in range(self.class_combo.count())]
         next_id = 0
-        while next_id in existing_ids:
+        while next_id in self._class_index_by_id:
             next_id += 1
         class_id_spin.setValue(next_id)
         
@@ -770,7 +839,6 @@ class AnnotationEditor(QDialog):
             class_name = class_name_edit.text().strip()
             
             if not class_name:
-                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.warning(
                     self,
                     tr("component.annotation_editor.warning"),
@@ -781,117 +849,215 @@ class AnnotationEditor(QDialog):
             # Ajouter la classe au dictionnaire des classes
             self.dataset.classes[class_id] = class_name
             
-            # Ajouter la classe à la liste déroulante
-            self.class_combo.addItem(class_name, class_id)
-            
-            # Sélectionner la nouvelle classe
-            index = self.class_combo.findData(class_id)
-            if index >= 0:
-                self.class_combo.setCurrentIndex(index)
+            # Ajouter la classe à la liste déroulante et la sélectionner
+            self.class_combo.setCurrentIndex(self._add_class_item(class_id, class_name))
+    
+    def _connect_history_signals(self):
+        """Connecte les champs éditables à l'enregistrement de l'historique."""
+        self.class_combo.currentIndexChanged.connect(self._save_to_history)
+        self.x_spin.valueChanged.connect(self._save_to_history)
+        self.y_spin.valueChanged.connect(self._save_to_history)
+        self.width_spin.valueChanged.connect(self._save_to_history)
+        self.height_spin.valueChanged.connect(self._save_to_history)
+        self.conf_spin.valueChanged.connect(self._save_to_history)
+    
+    def _save_to_history(self, *args):
+        """
+        Programme la sauvegarde de l'état actuel dans l'historique.
+        Les modifications rapprochées (glissement d'un spinbox, etc.)
+        sont regroupées en une seule entrée.
+        """
+        self._history_timer.start()
+    
+    def _flush_history(self):
+        """Enregistre immédiatement une sauvegarde en attente."""
+        if self._history_timer.isActive():
+            self._history_timer.stop()
+            self._save_to_history_now()
+    
+    def _capture_state(self) -> EditorState:
+        """
+        Capture l'état courant des champs éditables.
+        
+        Returns:
+            État courant (class_id, x, y, width, height, confidence)
+        """
+        return EditorState(
+            self.class_combo.currentData(),
+            self.x_spin.value(),
+            self.y_spin.value(),
+            self.width_spin.value(),
+            self.height_spin.value(),
+            self.conf_spin.value()
+        )
+    
+    def _reset_history(self):
+        """Vide l'historique et prend l'état courant comme référence."""
+        self._history_timer.stop()
+        
+        # Vider l'historique existant sur place plutôt que de le réallouer
+        if self.annotation_history is not None:
+            self.annotation_history.clear()
+        self.history_position = -1
+        self._current_state = self._capture_state()
+        self._refresh_history_buttons()
+    
+    @contextmanager
+    def _transact(self):
+        """
+        Modifie les champs éditables sans déclencher leurs signaux.
+        
+        À la sortie, les labels en pixels et les boutons annuler/rétablir
+        sont mis à jour une seule fois.
+        """
+        with ExitStack() as stack:
+            for widget in self._state_widgets:
+                stack.enter_context(QSignalBlocker(widget))
+            yield
+        
+        # Les signaux étant bloqués, mettre à jour l'affichage manuellement
+        self._update_pixel_labels()
+        self._refresh_history_buttons()
     
-    def _save_to_history(self):
-        """Sauvegarde l'état actuel dans l'historique."""
+    def _refresh_history_buttons(self):
+        """Met à jour l'état des boutons annuler/rétablir."""
+        if self.undo_button is None or self.redo_button is None:
+            return
+        
+        can_undo = self.history_position >= 0
+        can_redo = (
+            self.annotation_history is not None
+            and self.history_position < len(self.annotation_history) - 1
+        )
+        
+        # Ne toucher aux boutons que si leur état change
+        if self.undo_button.isEnabled() != can_undo:
+            self.undo_button.setEnabled(can_undo)
+        if self.redo_button.isEnabled() != can_redo:
+            self.redo_button.setEnabled(can_redo)
+    
+    def _save_to_history_now(self):
+        """Enregistre dans l'historique les champs modifiés depuis le dernier état."""
         if not self.is_edit_mode or not self.original_annotation:
             return
         
-        # Créer un instantané de l'état actuel
-        state = {
-            "class_id": self.class_combo.currentData(),
-            "x": self.x_spin.value(),
-            "y": self.y_spin.value(),
-            "width": self.width_spin.value(),
-            "height": self.height_spin.value(),
-            "confidence": self.conf_spin.value()
-        }
+        state = self._capture_state()
         
-        # Si nous sommes au milieu de l'historique, supprimer les états après
-        if self.history_position < len(self.annotation_history) - 1:
-            self.annotation_history = self.annotation_history[:self.history_position + 1]
+        # Ignorer si rien n'a changé depuis l'état courant
+        if state == self._current_state:
+            return
+        
+        # Ne conserver que les champs modifiés
+        changes = tuple(
+            FieldDelta(field, old, new)
+            for field, (old, new) in enumerate(zip(self._current_state, state))
+            if old != new
+        )
         
-        # Ajouter l'état à l'historique
-        self.annotation_history.append(state)
+        # Allouer l'historique à la première modification
+        if self.annotation_history is None:
+            self.annotation_history = deque(maxlen=self.MAX_HISTORY)
+        
+        # Si nous sommes au milieu de l'historique, supprimer les modifications après
+        while len(self.annotation_history) > self.history_position + 1:
+            self.annotation_history.pop()
+        
+        # Ajouter les modifications à l'historique
+        self.annotation_history.append(changes)
         self.history_position = len(self.annotation_history) - 1
+        self._current_state = state
+        self._refresh_history_buttons()
+    
+    def _apply_changes(self, changes: Tuple, undo: bool):
+        """
+        Applique un groupe de modifications à l'état courant.
         
-        # Mettre à jour les boutons
-        if hasattr(self, 'undo_button') and hasattr(self, 'redo_button'):
-            self.undo_button.setEnabled(self.history_position > 0)
-            self.redo_button.setEnabled(False)
+        Args:
+            changes: Modifications (FieldDelta) à appliquer
+            undo: True pour revenir aux anciennes valeurs, False pour les nouvelles
+        """
+        values = list(self._current_state)
+        for delta in changes:
+            values[delta.field] = delta.old if undo else delta.new
+        self._current_state = EditorState._make(values)
+        self._restore_state(self._current_state)
     
     def _undo(self):
         """Annule la dernière modification."""
-        if not self.is_edit_mode or self.history_position <= 0:
+        self._flush_history()
+        if not self.is_edit_mode or self.history_position < 0:
             return
         
-        # Décrémenter la position
+        # Décrémenter la position puis revenir aux anciennes valeurs
+        changes = self.annotation_history[self.history_position]
         self.history_position -= 1
-        
-        # Restaurer l'état précédent
-        self._restore_state(self.annotation_history[self.history_position])
-        
-        # Mettre à jour les boutons
-        self.undo_button.setEnabled(self.history_position > 0)
-        self.redo_button.setEnabled(self.history_position < len(self.annotation_history) - 1)
+        self._apply_changes(changes, undo=True)
     
     def _redo(self):
         """Rétablit la dernière modification annulée."""
-        if not self.is_edit_mode or self.history_position >= len(self.annotation_history) - 1:
+        self._flush_history()
+        if (
+            not self.is_edit_mode
+            or self.annotation_history is None
+            or self.history_position >= len(self.annotation_history) - 1
+        ):
             return
         
-        # Incrémenter la position
+        # Incrémenter la position puis appliquer les nouvelles valeurs
         self.history_position += 1
-        
-        # Restaurer l'état suivant
-        self._restore_state(self.annotation_history[self.history_position])
-        
-        # Mettre à jour les boutons
-        self.undo_button.setEnabled(self.history_position > 0)
-        self.redo_button.setEnabled(self.history_position < len(self.annotation_history) - 1)
+        self._apply_changes(self.annotation_history[self.history_position], undo=False)
     
-    def _restore_state(self, state: Dict):
+    def _restore_state(self, state: EditorState):
         """
         Restaure l'éditeur à un état spécifique.
         
         Args:
             state: État à restaurer
         """
-        # Restaurer la classe
-        index = self.class_combo.findData(state["class_id"])
-        if index >= 0:
-            self.class_combo.setCurrentIndex(index)
-        
-        # Restaurer les coordonnées
-        self.x_spin.setValue(state["x"])
-        self.y_spin.setValue(state["y"])
-        self.width_spin.setValue(state["width"])
-        self.height_spin.setValue(state["height"])
-        
-        # Restaurer la confiance
-        self.conf_spin.setValue(state["confidence"])
+        with self._transact():
+            # Restaurer la classe
+            index = self._class_index_by_id.get(state.class_id, -1)
+            if index >= 0:
+                self.class_combo.setCurrentIndex(index)
+            
+            # Restaurer les coordonnées
+            self.x_spin.setValue(state.x)
+            self.y_spin.setValue(state.y)
+            self.width_spin.setValue(state.width)
+            self.height_spin.setValue(state.height)
+            
+            # Restaurer la confiance
+            self.conf_spin.setValue(state.confidence)
+            self.conf_slider.setValue(int(state.confidence * 100))
     
     def _duplicate_annotation(self):
         """Duplique l'annotation courante avec un léger décalage."""
         # Obtenir les valeurs actuelles
         class_id = self.class_combo.currentData()
+        if class_id is None:
+            return
         x = self.x_spin.value()
         y = self.y_spin.value()
         width = self.width_spin.value()
         height = self.height_spin.value()
         confidence = self.conf_spin.value()
         
-        # Créer une boîte englobante légèrement décalée
-        offset = 0.02  # 2% de décalage
-        new_x = min(x + offset, 1 - width)
-        new_y = min(y + offset, 1 - height)
+        # Créer une boîte englobante légèrement décalée, bornée à l'image
+        offset = self.DUPLICATE_OFFSET
+        new_x = max(0.0, min(x + offset, 1.0 - width))
+        new_y = max(0.0, min(y + offset, 1.0 - height))
         
-        # Créer une nouvelle annotation
-        bbox = BoundingBox(
+        # Créer une nouvelle annotation sans repasser par la validation:
+        # les valeurs proviennent de spinbox bornés à [0, 1] et le décalage
+        # garantit x + width <= 1 et y + height <= 1
+        bbox = BoundingBox.model_construct(
             x=new_x,
             y=new_y,
             width=width,
             height=height
         )
         
-        new_annotation = Annotation(
+        new_annotation = Annotation.model_construct(
             class_id=class_id,
             bbox=bbox,
             confidence=confidence,
@@ -902,43 +1068,56 @@ class AnnotationEditor(QDialog):
         self.image.add_annotation(new_annotation)
         self.annotation_added.emit(new_annotation)
         
-        # Confirmer à l'utilisateur
-        from PyQt6.QtWidgets import QMessageBox
-        QMessageBox.information(
-            self,
-            tr("component.annotation_editor.duplicate_success_title"),
-            tr("component.annotation_editor.duplicate_success_message")
-        )
+        # Confirmer à l'utilisateur sans bloquer l'édition
+        self._show_status(tr("component.annotation_editor.duplicate_success_message"))
+    
+    def _show_status(self, message: str):
+        """
+        Affiche un message d'état temporaire sous les onglets.
+        
+        Args:
+            message: Message à afficher
+        """
+        self.status_label.setText(message)
+        self._status_timer.start()
     
     def _reset_annotation(self):
         """Réinitialise l'annotation à son état d'origine."""
         if self.original_annotation and self.is_edit_mode:
             self._load_annotation(self.original_annotation)
             
-            # Réinitialiser l'historique
-            self.annotation_history = []
-            self._save_to_history()  # Sauvegarder l'état initial
+            # Réinitialiser l'historique à partir de l'état d'origine
+            self._reset_history()
+    
+    def _build_keymap(self):
+        """Construit la table des raccourcis clavier: (ctrl, touche) -> action."""
+        self._keymap = {
+            (False, Qt.Key.Key_Escape.value): self.reject,
+            (True, Qt.Key.Key_S.value): self._save_annotation,
+        }
+        
+        if self.is_edit_mode:
+            self._keymap.update({
+                (True, Qt.Key.Key_Z.value): self._undo,
+                (True, Qt.Key.Key_Y.value): self._redo,
+                (True, Qt.Key.Key_D.value): self._duplicate_annotation,
+                (True, Qt.Key.Key_R.value): self._reset_annotation,
+            })
     
     def keyPressEvent(self, event):
         """Gère les événements clavier."""
-        from PyQt6.QtCore import Qt
+        key = event.key()
         
-        # Touches de raccourci
-        if event.key() == Qt.Key.Key_Escape:
-            self.reject()
-        elif event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
-            if not (isinstance(event.source(), QSpinBox) or isinstance(event.source(), QDoubleSpinBox)):
-                self._save_annotation()
-        elif event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            if event.key() == Qt.Key.Key_S:
+        # Entrée valide le dialogue, sauf pendant la saisie dans un spinbox
+        if key in self.VALIDATE_KEYS:
+            if not isinstance(self.focusWidget(), (QSpinBox, QDoubleSpinBox)):
                 self._save_annotation()
-            elif event.key() == Qt.Key.Key_Z and self.is_edit_mode:
-                self._undo()
-            elif event.key() == Qt.Key.Key_Y and self.is_edit_mode:
-                self._redo()
-            elif event.key() == Qt.Key.Key_D and self.is_edit_mode:
-                self._duplicate_annotation()
-            elif event.key() == Qt.Key.Key_R and self.is_edit_mode:
-                self._reset_annotation()
+            return
+        
+        # Touches de raccourci
+        ctrl = bool(event.modifiers() & self.CTRL_MODIFIER)
+        handler = self._keymap.get((ctrl, key))
+        if handler is not None:
+            handler()
         else:
-            super().keyPressEvent(event)
\ No newline at end of file
+            super().keyPressEvent(event)
@@ -4,9 +4,20 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QScrollArea, 
     QSizePolicy, QFrame, QHBoxLayout, QPushButton
 )
-from PyQt6.QtCore import Qt, QRect, QPoint, QSize, pyqtSignal
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QColor, QBrush, QMouseEvent, QPaintEvent, QWheelEvent
-from typing import List, Optional, Dict, Tuple
+from PyQt6.QtCore import (
+    Qt, QRect, QPoint, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QBuffer, QByteArray, QIODevice
+)
+from PyQt6.QtGui import (
+    QPixmap, QPainter, QPen, QColor, QBrush, QMouseEvent, QPaintEvent, QWheelEvent,
+    QStaticText, QTransform, QImage, QImageReader, QPixmapCache
+)
+from typing import List, Optional, Dict, Tuple, Union
+from functools import lru_cache
+from collections import OrderedDict
+import os
+import sys
+import numpy as np
 
 from src.utils.i18n import get_translation_manager, tr
 from src.models import Image, Annotation, BoundingBox
@@ -30,6 +41,33 @@ class ImageViewerWidget(QWidget):
     MODE_CREATE = 1 
     MODE_EDIT = 2
     
+    # Taille (px) des poignées de redimensionnement
+    HANDLE_SIZE = 8
+    
+    # Styles de dessin, créés une seule fois
+    DEFAULT_PEN = QPen(QColor(0, 255, 0), 2)  # Vert par défaut
+    DEFAULT_BRUSH = QBrush(QColor(0, 255, 0, 60))  # Vert avec alpha
+    SELECTED_PEN = QPen(QColor(255, 0, 0), 2)  # Rouge pour la sélection
+    SELECTED_BRUSH = QBrush(QColor(255, 0, 0, 80))  # Rouge avec alpha
+    CREATE_PEN = QPen(QColor(0, 0, 255), 2)  # Bleu pour la création
+    CREATE_BRUSH = QBrush(QColor(0, 0, 255, 60))
+    HANDLE_PEN = QPen(QColor(255, 0, 0))
+    HANDLE_BRUSH = QBrush(QColor(255, 255, 255))
+    LABEL_BACKGROUND = QColor(0, 0, 0, 180)
+    LABEL_FOREGROUND = QColor(255, 255, 255)
+    
+    # Côtés déplacés par chaque poignée: (gauche, haut, droite, bas)
+    HANDLE_DELTAS = {
+        "top_left": (1, 1, 0, 0),
+        "top_right": (0, 1, 1, 0),
+        "bottom_left": (1, 0, 0, 1),
+        "bottom_right": (0, 0, 1, 1),
+        "top_center": (0, 1, 0, 0),
+        "bottom_center": (0, 0, 0, 1),
+        "left_center": (1, 0, 0, 0),
+        "right_center": (0, 0, 1, 0)
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -41,6 +79,7 @@ class ImageViewerWidget(QWidget):
         # État
         self.original_pixmap = None  # Pixmap original non zoomé
         self.pixmap = None  # Pixmap affiché (potentiellement zoomé)
+        self.display_size = QSize()  # Taille affichée, en pixels logiques
         self.annotations = []
         self.selected_index = -1
         self.edit_mode = self.MODE_VIEW
@@ -49,12 +88,33 @@ class ImageViewerWidget(QWidget):
         # État d'édition
         self.current_rect = None
         self.start_point = None
-        self.resize_handles = {}
+        self._handle_rects = []  # Poignées de l'annotation sélectionnée
+        self._handle_names = []  # Noms des poignées, parallèles à _handle_rects
         self.dragging = False
         self.resizing = False
         self.resize_handle = None
         self.drag_start_pos = None
         self.drag_start_rect = None
+        self._live_rect = None  # Rectangle en cours de déplacement/redimensionnement
+        
+        # Cache des rectangles d'annotation en coordonnées affichées
+        self._cached_rects = []
+        self._bbox_norm = np.empty((0, 4), dtype=np.float64)  # (x, y, width, height) normalisés
+        self._bbox_xyxy = np.empty((0, 4), dtype=np.int32)  # (x0, y0, x1, y1) pour le hit-testing
+        self._cache_key = None
+        
+        # Cache des libellés pré-mis en page: (class_id, confiance) -> (texte, taille)
+        self._label_cache = {}
+        self._class_label_prefix = tr("component.image_viewer.class_label")
+        
+        # Les libellés dépendent de la langue
+        self.translation_manager = get_translation_manager()
+        self.translation_manager.language_changed.connect(self._on_language_changed)
+        
+        # Rendu mis en cache de l'image et de ses annotations
+        self._overlay_pixmap = None
+        self._overlay_dirty = True
+        self._overlay_dirty_rect = None  # Zone à redessiner lors d'une mise à jour partielle
         
         # Apparence
         self.setMinimumSize(200, 200)
@@ -79,15 +139,114 @@ class ImageViewerWidget(QWidget):
                 self.pixmap = scaled_pixmap
             else:
                 self.pixmap = original_pixmap
+            
+            # Taille logique: un pixmap HiDPI contient plus de pixels qu'il n'en occupe
+            self.display_size = self.pixmap.deviceIndependentSize().toSize()
                 
-            self.setMinimumSize(self.pixmap.size())
-            self.resize(self.pixmap.size())
+            self.setMinimumSize(self.display_size)
+            self.resize(self.display_size)
+            self._invalidate_rect_cache()
+            self._update_handles_for_selected()
             self.update()
             
+    def clear_pixmap(self):
+        """Retire l'image affichée (chargement en cours ou image effacée)."""
+        self.original_pixmap = None
+        self.pixmap = None
+        self._overlay_pixmap = None
+        self._invalidate_rect_cache()
+        self.update()
+            
     def set_annotations(self, annotations):
         """Définit les annotations à afficher"""
         self.annotations = annotations
         self.selected_index = -1
+        self._live_rect = None
+        self._pack_bboxes()
+        self._invalidate_rect_cache()
+        self._label_cache.clear()
+        self._update_handles_for_selected()
+        self.update()
+    
+    def _invalidate_rect_cache(self):
+        """Force le recalcul des rectangles d'annotation et du rendu au prochain accès."""
+        self._cache_key = None
+        self._overlay_dirty = True
+    
+    def _pack_bboxes(self):
+        """Copie les bounding boxes des annotations dans un tableau (N, 4) contigu."""
+        self._bbox_norm = np.fromiter(
+            (v for a in self.annotations for v in (a.bbox.x, a.bbox.y, a.bbox.width, a.bbox.height)),
+            dtype=np.float64,
+            count=4 * len(self.annotations)
+        ).reshape(-1, 4)
+        
+        # Les annotations créées sans validation (model_construct) peuvent sortir de [0, 1]
+        np.clip(self._bbox_norm, 0.0, 1.0, out=self._bbox_norm)
+    
+    def _ensure_rect_cache(self) -> List[QRect]:
+        """
+        Retourne les rectangles des annotations en coordonnées affichées.
+        
+        Les rectangles ne sont recalculés que si la taille affichée ou
+        la liste d'annotations a changé depuis le dernier appel.
+        
+        Returns:
+            Liste de QRect, dans l'ordre des annotations
+        """
+        display_width = self.display_size.width()
+        display_height = self.display_size.height()
+        key = (display_width, display_height, id(self.annotations), len(self.annotations))
+        
+        if key != self._cache_key:
+            # La liste a pu être modifiée sans passer par set_annotations
+            if len(self._bbox_norm) != len(self.annotations):
+                self._pack_bboxes()
+            
+            # Conversion en pixels affichés en une seule passe
+            xywh = (self._bbox_norm * (display_width, display_height, display_width, display_height)).astype(np.int32)
+            self._bbox_xyxy = xywh.copy()
+            self._bbox_xyxy[:, 2:] += xywh[:, :2]
+            
+            self._cached_rects = [QRect(*row) for row in xywh.tolist()]
+            self._cache_key = key
+        
+        return self._cached_rects
+    
+    def _get_label(self, annotation) -> Tuple[QStaticText, QSize]:
+        """
+        Retourne le libellé pré-mis en page d'une annotation.
+        
+        Args:
+            annotation: Annotation dont on veut le libellé
+            
+        Returns:
+            Tuple (texte statique, taille du texte)
+        """
+        confidence = annotation.confidence if hasattr(annotation, 'confidence') else None
+        key = (annotation.class_id, None if confidence is None else round(confidence, 2))
+        
+        label = self._label_cache.get(key)
+        if label is None:
+            class_text = f"{self._class_label_prefix} {annotation.class_id}"
+            
+            # Ajouter la confiance si disponible
+            if confidence is not None:
+                class_text += f" ({confidence:.2f})"
+            
+            static_text = QStaticText(class_text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), self.font())
+            label = (static_text, static_text.size().toSize())
+            self._label_cache[key] = label
+        
+        return label
+        
+    def _on_language_changed(self, language_code: str):
+        """Met à jour les libellés des annotations après un changement de langue."""
+        self._class_label_prefix = tr("component.image_viewer.class_label")
+        self._label_cache.clear()
+        self._overlay_dirty = True
         self.update()
         
     def set_selected(self, index):
@@ -96,6 +255,8 @@ class ImageViewerWidget(QWidget):
             self.selected_index = index
         else:
             self.selected_index = -1
+        self._overlay_dirty = True
+        self._update_handles_for_selected()
         self.update()
     
     def set_edit_mode(self, mode):
@@ -114,98 +275,189 @@ class ImageViewerWidget(QWidget):
         
     def paintEvent(self, event):
         """Dessine l'image et les annotations"""
+        # Rien à dessiner si la zone est vide ou le widget masqué
+        if event.rect().isEmpty() or not self.isVisible():
+            return
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
+        # Ne redessiner que la zone invalidée
+        dirty = event.rect()
+        painter.setClipRect(dirty)
+        
         # Dessiner l'image
         if self.pixmap and not self.pixmap.isNull():
-            painter.drawPixmap(0, 0, self.pixmap)
-            
-            # Dimensions de l'image originale et affichée
-            displayed_width = self.pixmap.width()
-            displayed_height = self.pixmap.height()
-            original_width = self.original_pixmap.width()
-            original_height = self.original_pixmap.height()
-            
-            # Dessiner les annotations
-            for i, annotation in enumerate(self.annotations):
-                # Convertir les coordonnées normalisées en pixels affichés
-                x = int(annotation.bbox.x * displayed_width)
-                y = int(annotation.bbox.y * displayed_height)
-                width = int(annotation.bbox.width * displayed_width)
-                height = int(annotation.bbox.height * displayed_height)
-                
-                rect = QRect(x, y, width, height)
-                
-                # Couleur selon la sélection
-                if i == self.selected_index:
-                    # Rouge pour la sélection
-                    pen_color = QColor(255, 0, 0)
-                    fill_color = QColor(255, 0, 0, 80)  # Rouge avec alpha
-                else:
-                    # Vert par défaut
-                    pen_color = QColor(0, 255, 0) 
-                    fill_color = QColor(0, 255, 0, 60)  # Vert avec alpha
-                
-                # Dessiner le rectangle rempli
-                painter.setPen(QPen(pen_color, 2))
-                painter.setBrush(QBrush(fill_color))
-                painter.drawRect(rect)
-                
-                # Afficher la classe
-                if hasattr(annotation, 'class_id'):
-                    class_text = f"{tr('component.image_viewer.class_label')} {annotation.class_id}"
-                    
-                    # Ajouter la confiance si disponible
-                    if hasattr(annotation, 'confidence') and annotation.confidence is not None:
-                        class_text += f" ({annotation.confidence:.2f})"
-                    
-                    # Créer un fond pour le texte
-                    text_rect = painter.fontMetrics().boundingRect(class_text)
-                    text_rect.moveTopLeft(rect.topLeft() + QPoint(5, 5))
-                    text_rect.adjust(-2, -2, 2, 2)
-                    
-                    painter.fillRect(text_rect, QColor(0, 0, 0, 180))
-                    painter.setPen(QColor(255, 255, 255))
-                    painter.drawText(rect.topLeft() + QPoint(5, 15), class_text)
+            # L'image et les annotations ne sont redessinées que si elles ont changé
+            if self._overlay_dirty or self._overlay_pixmap is None:
+                self._rebuild_overlay()
+            elif self._overlay_dirty_rect is not None:
+                self._repaint_overlay(self._overlay_dirty_rect)
+            painter.drawPixmap(0, 0, self._overlay_pixmap)
             
             # Dessiner le rectangle en cours de création
             if self.edit_mode == self.MODE_CREATE and self.current_rect:
-                painter.setPen(QPen(QColor(0, 0, 255), 2))
-                painter.setBrush(QBrush(QColor(0, 0, 255, 60)))
+                painter.setPen(self.CREATE_PEN)
+                painter.setBrush(self.CREATE_BRUSH)
                 painter.drawRect(self.current_rect)
                 
             # Dessiner les poignées si nécessaire
             if self.edit_mode == self.MODE_EDIT and self.selected_index >= 0:
-                annotation = self.annotations[self.selected_index]
-                x = int(annotation.bbox.x * displayed_width)
-                y = int(annotation.bbox.y * displayed_height)
-                width = int(annotation.bbox.width * displayed_width)
-                height = int(annotation.bbox.height * displayed_height)
-                
-                rect = QRect(x, y, width, height)
-                self._draw_resize_handles(painter, rect)
+                self._draw_resize_handles(painter)
     
-    def _draw_resize_handles(self, painter, rect):
+    def _rebuild_overlay(self):
+        """Dessine l'image et toutes les annotations dans le pixmap mis en cache."""
+        if not self.pixmap or self.pixmap.isNull():
+            return
+        
+        # Format prémultiplié: chemin le plus rapide du moteur raster pour les remplissages alpha
+        ratio = self.pixmap.devicePixelRatio()
+        overlay = QImage(self.pixmap.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        overlay.setDevicePixelRatio(ratio)
+        overlay.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(overlay)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        try:
+            painter.drawPixmap(0, 0, self.pixmap)
+            self._paint_annotations(painter)
+        finally:
+            painter.end()
+        
+        self._overlay_pixmap = QPixmap.fromImage(overlay)
+        self._overlay_dirty = False
+        self._overlay_dirty_rect = None
+    
+    def _repaint_overlay(self, region: QRect):
+        """
+        Redessine une zone du pixmap mis en cache.
+        
+        Args:
+            region: Zone à redessiner, en coordonnées affichées
+        """
+        painter = QPainter(self._overlay_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRect(region)
+        
+        try:
+            # Le clip limite la copie à la zone (en pixels logiques, quel que soit le ratio).
+            # La copie remplace les pixels de la zone, alpha compris: sur une image
+            # transparente, les anciens remplissages ne restent pas dessous.
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawPixmap(0, 0, self.pixmap)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            self._paint_annotations(painter, region)
+        finally:
+            painter.end()
+        
+        self._overlay_dirty_rect = None
+    
+    def _paint_annotations(self, painter: QPainter, region: Optional[QRect] = None):
+        """
+        Dessine les rectangles et les libellés des annotations.
+        
+        Args:
+            painter: Painter cible
+            region: Si fournie, seules les annotations qui la recoupent sont dessinées
+        """
+        # Rectangles des annotations en pixels affichés
+        rects = self._ensure_rect_cache()
+        selected = self.selected_index
+        
+        if region is None:
+            visible = range(len(rects))
+        else:
+            visible = [
+                i for i, annotation in enumerate(self.annotations)
+                if self._annotation_bounds(annotation, rects[i]).intersects(region)
+            ]
+        
+        # Dessiner les rectangles en deux appels groupés: vert par défaut, rouge pour la sélection
+        painter.setPen(self.DEFAULT_PEN)
+        painter.setBrush(self.DEFAULT_BRUSH)
+        painter.drawRects([rects[i] for i in visible if i != selected])
+        
+        if selected in visible:
+            painter.setPen(self.SELECTED_PEN)
+            painter.setBrush(self.SELECTED_BRUSH)
+            painter.drawRects([rects[selected]])
+        
+        # Afficher les classes par-dessus les rectangles
+        painter.setPen(self.LABEL_FOREGROUND)
+        for i in visible:
+            annotation = self.annotations[i]
+            if hasattr(annotation, 'class_id'):
+                static_text, text_rect = self._label_geometry(annotation, rects[i])
+                painter.fillRect(text_rect, self.LABEL_BACKGROUND)
+                painter.drawStaticText(text_rect.topLeft() + QPoint(2, 2), static_text)
+    
+    def _label_geometry(self, annotation, rect: QRect) -> Tuple[QStaticText, QRect]:
+        """
+        Calcule la position du libellé d'une annotation.
+        
+        Args:
+            annotation: Annotation concernée
+            rect: Rectangle de l'annotation en coordonnées affichées
+            
+        Returns:
+            Tuple (texte statique, rectangle de fond du texte)
+        """
+        static_text, text_size = self._get_label(annotation)
+        text_rect = QRect(rect.topLeft() + QPoint(5, 5), text_size).adjusted(-2, -2, 2, 2)
+        return static_text, text_rect
+    
+    def _annotation_bounds(self, annotation, rect: QRect) -> QRect:
+        """
+        Retourne la zone couverte par une annotation dessinée (trait, libellé et poignées).
+        
+        Args:
+            annotation: Annotation concernée
+            rect: Rectangle de l'annotation en coordonnées affichées
+            
+        Returns:
+            Rectangle englobant en coordonnées affichées
+        """
+        margin = self.HANDLE_SIZE
+        bounds = rect.adjusted(-margin, -margin, margin, margin)
+        if hasattr(annotation, 'class_id'):
+            bounds = bounds.united(self._label_geometry(annotation, rect)[1])
+        return bounds
+    
+    def _update_handles_for_selected(self):
+        """Recalcule les poignées de redimensionnement de l'annotation sélectionnée."""
+        if not self.pixmap or not (0 <= self.selected_index < len(self.annotations)):
+            self._handle_rects = []
+            self._handle_names = []
+            return
+        
+        rect = self._ensure_rect_cache()[self.selected_index]
+        size = self.HANDLE_SIZE
+        half = size // 2
+        left, top = rect.left() - half, rect.top() - half
+        right, bottom = rect.right() - half, rect.bottom() - half
+        center_x, center_y = rect.center().x() - half, rect.center().y() - half
+        
+        self._handle_names = [
+            "top_left", "top_right", "bottom_left", "bottom_right",
+            "top_center", "bottom_center", "left_center", "right_center"
+        ]
+        self._handle_rects = [
+            QRect(left, top, size, size),
+            QRect(right, top, size, size),
+            QRect(left, bottom, size, size),
+            QRect(right, bottom, size, size),
+            QRect(center_x, top, size, size),
+            QRect(center_x, bottom, size, size),
+            QRect(left, center_y, size, size),
+            QRect(right, center_y, size, size)
+        ]
+    
+    def _draw_resize_handles(self, painter):
         """Dessine les poignées de redimensionnement"""
-        handle_size = 8
-        
-        painter.setPen(QPen(QColor(255, 0, 0)))
-        painter.setBrush(QBrush(QColor(255, 255, 255)))
-        
-        # Stocker les poignées
-        self.resize_handles = {
-            "top_left": QRect(rect.left() - handle_size//2, rect.top() - handle_size//2, handle_size, handle_size),
-            "top_right": QRect(rect.right() - handle_size//2, rect.top() - handle_size//2, handle_size, handle_size),
-            "bottom_left": QRect(rect.left() - handle_size//2, rect.bottom() - handle_size//2, handle_size, handle_size),
-            "bottom_right": QRect(rect.right() - handle_size//2, rect.bottom() - handle_size//2, handle_size, handle_size),
-            "top_center": QRect(rect.center().x() - handle_size//2, rect.top() - handle_size//2, handle_size, handle_size),
-            "bottom_center": QRect(rect.center().x() - handle_size//2, rect.bottom() - handle_size//2, handle_size, handle_size),
-            "left_center": QRect(rect.left() - handle_size//2, rect.center().y() - handle_size//2, handle_size, handle_size),
-            "right_center": QRect(rect.right() - handle_size//2, rect.center().y() - handle_size//2, handle_size, handle_size)
-        }
-        
-        for handle_rect in self.resize_handles.values():
+        painter.setPen(self.HANDLE_PEN)
+        painter.setBrush(self.HANDLE_BRUSH)
+        
+        for handle_rect in self._handle_rects:
             painter.drawRect(handle_rect)
     
     def mousePressEvent(self, event):
@@ -221,23 +473,14 @@ class ImageViewerWidget(QWidget):
             
         elif self.edit_mode == self.MODE_EDIT:
             # Vérifier si on clique sur une poignée
-            for handle_name, handle_rect in self.resize_handles.items():
+            for handle_name, handle_rect in zip(self._handle_names, self._handle_rects):
                 if handle_rect.contains(event.pos()):
                     self.resizing = True
                     self.resize_handle = handle_name
                     self.drag_start_pos = event.pos()
                     
                     # Récupérer le rectangle de l'annotation
-                    annotation = self.annotations[self.selected_index]
-                    display_width = self.pixmap.width()
-                    display_height = self.pixmap.height()
-                    
-                    x = int(annotation.bbox.x * display_width)
-                    y = int(annotation.bbox.y * display_height)
-                    width = int(annotation.bbox.width * display_width)
-                    height = int(annotation.bbox.height * display_height)
-                    
-                    self.drag_start_rect = QRect(x, y, width, height)
+                    self.drag_start_rect = QRect(self._ensure_rect_cache()[self.selected_index])
                     return
             
             # Vérifier si on clique sur une annotation pour la sélectionner ou la déplacer
@@ -248,6 +491,8 @@ class ImageViewerWidget(QWidget):
                 if clicked_index != self.selected_index:
                     self.selected_index = clicked_index
                     self.annotation_selected.emit(clicked_index)
+                    self._overlay_dirty = True
+                    self._update_handles_for_selected()
                     self.update()
                 
                 # Préparer pour le déplacement
@@ -255,20 +500,13 @@ class ImageViewerWidget(QWidget):
                 self.drag_start_pos = event.pos()
                 
                 # Récupérer le rectangle de l'annotation
-                annotation = self.annotations[self.selected_index]
-                display_width = self.pixmap.width()
-                display_height = self.pixmap.height()
-                
-                x = int(annotation.bbox.x * display_width)
-                y = int(annotation.bbox.y * display_height)
-                width = int(annotation.bbox.width * display_width)
-                height = int(annotation.bbox.height * display_height)
-                
-                self.drag_start_rect = QRect(x, y, width, height)
+                self.drag_start_rect = QRect(self._ensure_rect_cache()[self.selected_index])
             else:
                 # Désélectionner
                 self.selected_index = -1
                 self.annotation_selected.emit(-1)
+                self._overlay_dirty = True
+                self._update_handles_for_selected()
                 self.update()
                 
     def mouseMoveEvent(self, event):
@@ -287,51 +525,17 @@ class ImageViewerWidget(QWidget):
                 dx = event.pos().x() - self.drag_start_pos.x()
                 dy = event.pos().y() - self.drag_start_pos.y()
                 
-                new_rect = QRect(self.drag_start_rect)
-                
-                if self.resize_handle == "top_left":
-                    new_rect.setTopLeft(self.drag_start_rect.topLeft() + QPoint(dx, dy))
-                elif self.resize_handle == "top_right":
-                    new_rect.setTopRight(self.drag_start_rect.topRight() + QPoint(dx, dy))
-                elif self.resize_handle == "bottom_left":
-                    new_rect.setBottomLeft(self.drag_start_rect.bottomLeft() + QPoint(dx, dy))
-                elif self.resize_handle == "bottom_right":
-                    new_rect.setBottomRight(self.drag_start_rect.bottomRight() + QPoint(dx, dy))
-                elif self.resize_handle == "top_center":
-                    new_rect.setTop(self.drag_start_rect.top() + dy)
-                elif self.resize_handle == "bottom_center":
-                    new_rect.setBottom(self.drag_start_rect.bottom() + dy)
-                elif self.resize_handle == "left_center":
-                    new_rect.setLeft(self.drag_start_rect.left() + dx)
-                elif self.resize_handle == "right_center":
-                    new_rect.setRight(self.drag_start_rect.right() + dx)
+                # Déplacer les côtés associés à la poignée
+                left, top, right, bottom = self.HANDLE_DELTAS[self.resize_handle]
+                new_rect = self.drag_start_rect.adjusted(left * dx, top * dy, right * dx, bottom * dy)
                 
                 # Normaliser et limiter aux dimensions de l'image
                 new_rect = new_rect.normalized()
-                new_rect = new_rect.intersected(QRect(0, 0, self.pixmap.width(), self.pixmap.height()))
+                new_rect = new_rect.intersected(QRect(QPoint(0, 0), self.display_size))
                 
                 # S'assurer que le rectangle a une taille minimale
                 if new_rect.width() > 5 and new_rect.height() > 5:
-                    # Mettre à jour l'annotation
-                    display_width = self.pixmap.width()
-                    display_height = self.pixmap.height()
-                    
-                    # Convertir le rectangle en bbox (dans les coordonnées affichées)
-                    bbox = BoundingBox(
-                        x=max(0, min(1, new_rect.x() / display_width)),
-                        y=max(0, min(1, new_rect.y() / display_height)),
-                        width=max(0, min(1, new_rect.width() / display_width)),
-                        height=max(0, min(1, new_rect.height() / display_height))
-                    )
-                    
-                    # Mettre à jour l'annotation
-                    self.annotations[self.selected_index].bbox = bbox
-                    
-                    # Émettre le signal de modification
-                    self.annotation_modified.emit(self.selected_index, new_rect)
-                    
-                    # Mettre à jour l'affichage
-                    self.update()
+                    self._set_live_rect(new_rect)
                     
             elif self.dragging and self.selected_index >= 0 and self.drag_start_rect:
                 # Déplacer l'annotation
@@ -347,7 +551,7 @@ class ImageViewerWidget(QWidget):
                 )
                 
                 # Limiter au cadre de l'image
-                display_rect = QRect(0, 0, self.pixmap.width(), self.pixmap.height())
+                display_rect = QRect(QPoint(0, 0), self.display_size)
                 if not display_rect.contains(new_rect):
                     # Ajuster pour rester dans l'image
                     if new_rect.left() < 0:
@@ -359,25 +563,7 @@ class ImageViewerWidget(QWidget):
                     if new_rect.bottom() > display_rect.bottom():
                         new_rect.moveBottom(display_rect.bottom())
                 
-                # Convertir le rectangle en bbox (dans les coordonnées affichées)
-                display_width = self.pixmap.width()
-                display_height = self.pixmap.height()
-                
-                bbox = BoundingBox(
-                    x=max(0, min(1, new_rect.x() / display_width)),
-                    y=max(0, min(1, new_rect.y() / display_height)),
-                    width=max(0, min(1, new_rect.width() / display_width)),
-                    height=max(0, min(1, new_rect.height() / display_height))
-                )
-                
-                # Mettre à jour l'annotation
-                self.annotations[self.selected_index].bbox = bbox
-                
-                # Émettre le signal de modification
-                self.annotation_modified.emit(self.selected_index, new_rect)
-                
-                # Mettre à jour l'affichage
-                self.update()
+                self._set_live_rect(new_rect)
             else:
                 # Mettre à jour le curseur en fonction de la position
                 if self.edit_mode == self.MODE_EDIT:
@@ -402,19 +588,70 @@ class ImageViewerWidget(QWidget):
             
         elif self.edit_mode == self.MODE_EDIT:
             # Fin du déplacement ou du redimensionnement
+            self._commit_live_rect()
             self.dragging = False
             self.resizing = False
             self.resize_handle = None
             self.drag_start_pos = None
             self.drag_start_rect = None
     
+    def _set_live_rect(self, rect: QRect):
+        """
+        Met à jour l'affichage de l'annotation en cours de déplacement ou de redimensionnement.
+        
+        Seul le cache d'affichage est modifié; la bounding box de l'annotation
+        n'est reconstruite qu'au relâchement de la souris.
+        
+        Args:
+            rect: Nouveau rectangle dans les coordonnées affichées
+        """
+        index = self.selected_index
+        annotation = self.annotations[index]
+        rects = self._ensure_rect_cache()
+        old_bounds = self._annotation_bounds(annotation, rects[index])
+        
+        rects[index] = rect
+        self._bbox_xyxy[index] = (rect.x(), rect.y(), rect.x() + rect.width(), rect.y() + rect.height())
+        self._live_rect = rect
+        
+        # Ne redessiner que l'ancienne et la nouvelle position
+        dirty = old_bounds.united(self._annotation_bounds(annotation, rect))
+        if self._overlay_dirty_rect is not None:
+            dirty = dirty.united(self._overlay_dirty_rect)
+        self._overlay_dirty_rect = dirty
+        
+        self._update_handles_for_selected()
+        self.update(dirty)
+    
+    def _commit_live_rect(self):
+        """Reporte le rectangle en cours d'édition dans l'annotation et émet la modification."""
+        rect = self._live_rect
+        self._live_rect = None
+        if rect is None or not (0 <= self.selected_index < len(self.annotations)):
+            return
+        
+        # Rien à signaler si l'annotation est revenue à sa position de départ
+        if rect == self.drag_start_rect:
+            return
+        
+        # Convertir le rectangle en bbox (dans les coordonnées affichées)
+        bbox = self.rect_to_bbox(rect)
+        self.annotations[self.selected_index].bbox = bbox
+        self._bbox_norm[self.selected_index] = (bbox.x, bbox.y, bbox.width, bbox.height)
+        self._invalidate_rect_cache()
+        self._update_handles_for_selected()
+        
+        # Émettre le signal de modification
+        self.annotation_modified.emit(self.selected_index, rect)
+        self.update()
+    
     def _update_cursor(self, pos):
         """Met à jour le curseur en fonction de la position"""
         if self.edit_mode != self.MODE_EDIT or self.selected_index < 0:
             return
             
         # Vérifier si on est sur une poignée
-        for handle_name, handle_rect in self.resize_handles.items():
+        for handle_name, handle_rect in zip(self._handle_names, self._handle_rects):
             if handle_rect.contains(pos):
                 if handle_name in ["top_left", "bottom_right"]:
                     self.setCursor(Qt.CursorShape.SizeFDiagCursor)
@@ -427,18 +664,7 @@ class ImageViewerWidget(QWidget):
                 return
         
         # Vérifier si on est sur l'annotation sélectionnée
-        annotation = self.annotations[self.selected_index]
-        display_width = self.pixmap.width()
-        display_height = self.pixmap.height()
-        
-        x = int(annotation.bbox.x * display_width)
-        y = int(annotation.bbox.y * display_height)
-        width = int(annotation.bbox.width * display_width)
-        height = int(annotation.bbox.height * display_height)
-        
-        rect = QRect(x, y, width, height)
-        
-        if rect.contains(pos):
+        if self._ensure_rect_cache()[self.selected_index].contains(pos):
             self.setCursor(Qt.CursorShape.SizeAllCursor)
         else:
             self.setCursor(Qt.CursorShape.ArrowCursor)
@@ -448,47 +674,283 @@ class ImageViewerWidget(QWidget):
         if not self.pixmap or not self.annotations:
             return -1
             
-        display_width = self.pixmap.width()
-        display_height = self.pixmap.height()
+        self._ensure_rect_cache()
+        arr = self._bbox_xyxy
+        px, py = pos.x(), pos.y()
         
-        for i, annotation in enumerate(self.annotations):
-            x = int(annotation.bbox.x * display_width)
-            y = int(annotation.bbox.y * display_height)
-            width = int(annotation.bbox.width * display_width)
-            height = int(annotation.bbox.height * display_height)
-            
-            rect = QRect(x, y, width, height)
-            if rect.contains(pos):
-                return i
-                
-        return -1
+        # Test d'inclusion vectorisé sur toutes les annotations
+        mask = (arr[:, 0] <= px) & (px < arr[:, 2]) & (arr[:, 1] <= py) & (py < arr[:, 3])
+        return int(np.argmax(mask)) if mask.any() else -1
 
-    def convert_to_original_coordinates(self, rect):
+    def rect_to_bbox(self, rect: QRect) -> BoundingBox:
         """
-        Convertit un rectangle des coordonnées affichées vers les coordonnées originales
+        Convertit un rectangle des coordonnées affichées en bounding box normalisée
         
         Args:
             rect: QRect dans les coordonnées de l'image affichée
             
         Returns:
-            QRect dans les coordonnées de l'image originale
+            BoundingBox normalisée, bornée à [0, 1]
         """
-        if not self.pixmap or not self.original_pixmap:
-            return rect
+        # Les coordonnées normalisées ne dépendent pas du zoom:
+        # pas besoin de repasser par les dimensions de l'image originale
+        sx = 1.0 / self.display_size.width()
+        sy = 1.0 / self.display_size.height()
+        
+        x, y = rect.x() * sx, rect.y() * sy
+        width, height = rect.width() * sx, rect.height() * sy
+        
+        # Bornage à [0, 1]: une seule comparaison chaînée dans le cas courant
+        return BoundingBox(
+            x=x if 0.0 <= x <= 1.0 else (0.0 if x < 0.0 else 1.0),
+            y=y if 0.0 <= y <= 1.0 else (0.0 if y < 0.0 else 1.0),
+            width=width if 0.0 <= width <= 1.0 else (0.0 if width < 0.0 else 1.0),
+            height=height if 0.0 <= height <= 1.0 else (0.0 if height < 0.0 else 1.0)
+        )
+
+
+# Systèmes de fichiers insensibles à la casse par défaut
+_CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
+
+def _name_key(name: str) -> str:
+    """
+    Normalise un nom de fichier pour la recherche dans un listing de dossier.
+    
+    Args:
+        name: Nom de fichier
+        
+    Returns:
+        Nom comparable selon la sensibilité à la casse du système
+    """
+    return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+
+@lru_cache(maxsize=64)
+def _scan_dir_cached(dirpath: str, mtime_ns: int) -> Dict[str, str]:
+    """
+    Liste le contenu d'un dossier en un seul parcours.
+    
+    Args:
+        dirpath: Chemin du dossier ('' pour le dossier courant)
+        mtime_ns: Date de modification du dossier, qui invalide le listing
+        
+    Returns:
+        Dictionnaire nom normalisé -> chemin des entrées du dossier
+    """
+    try:
+        with os.scandir(dirpath or ".") as entries:
+            return {_name_key(entry.name): os.path.join(dirpath, entry.name) for entry in entries}
+    except OSError:
+        return {}
+
+
+def _scan_dir(dirpath: str) -> Dict[str, str]:
+    """
+    Retourne le listing d'un dossier, relu seulement si le dossier a changé.
+    
+    Args:
+        dirpath: Chemin du dossier ('' pour le dossier courant)
+        
+    Returns:
+        Dictionnaire nom normalisé -> chemin des entrées du dossier (vide s'il n'existe pas)
+    """
+    try:
+        mtime_ns = os.stat(dirpath or ".").st_mtime_ns
+    except OSError:
+        return {}
+    return _scan_dir_cached(dirpath, mtime_ns)
+
+
+def decode_image(source: Union[str, bytes], max_size: Optional[QSize] = None,
+                 fmt: Optional[str] = None) -> Tuple[QImage, QSize]:
+    """
+    Décode une image, éventuellement réduite par le décodeur.
+    
+    Utilisable hors du thread graphique.
+    
+    Args:
+        source: Chemin du fichier image, ou contenu encodé déjà en mémoire
+        max_size: Taille maximale du décodage (None pour la pleine résolution)
+        fmt: Format de l'image (ex: "jpg"), deviné à partir du contenu si absent
+        
+    Returns:
+        Tuple (image décodée, nulle en cas d'échec ; taille native de l'image)
+    """
+    if isinstance(source, (bytes, bytearray)):
+        # Lire directement depuis la mémoire, sans passer par un fichier
+        buffer = QBuffer()
+        buffer.setData(QByteArray(bytes(source)))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        reader = QImageReader(buffer)
+    else:
+        reader = QImageReader(source)
+    if fmt:
+        reader.setFormat(fmt.encode())
+    
+    native_size = reader.size()
+    if (max_size is not None and native_size.isValid()
+            and (native_size.width() > max_size.width() or native_size.height() > max_size.height())):
+        reader.setScaledSize(native_size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio))
+    
+    return reader.read(), native_size
+
+
+class PixmapCache:
+    """
+    Cache LRU des images décodées, partagé par tous les visualiseurs.
+    
+    Les entrées sont indexées par (chemin, date de modification) afin qu'un
+    fichier modifié sur disque soit relu.
+    """
+    
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialise le cache.
+        
+        Args:
+            max_bytes: Mémoire maximale occupée par les pixmaps en cache
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # (chemin, mtime_ns, borne) -> (QPixmap, taille native)
+        self._total_bytes = 0
+        
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        """Estime la mémoire occupée par un pixmap."""
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        
+    @staticmethod
+    def _key(path: str, max_size: Optional[QSize]) -> tuple:
+        """Construit la clé d'un fichier pour une taille de décodage donnée."""
+        bound = (max_size.width(), max_size.height()) if max_size is not None else None
+        return (os.path.abspath(path), os.stat(path).st_mtime_ns, bound)
+        
+    def lookup(self, path: str, max_size: Optional[QSize] = None) -> Optional[Tuple[QPixmap, QSize]]:
+        """
+        Retourne l'entrée en cache d'un fichier sans le décoder.
+        
+        Args:
+            path: Chemin d'un fichier image existant
+            max_size: Taille maximale du décodage (None pour la pleine résolution)
             
-        # Facteur d'échelle entre l'affichage et l'original
-        display_width = self.pixmap.width()
-        display_height = self.pixmap.height()
-        original_width = self.original_pixmap.width()
-        original_height = self.original_pixmap.height()
+        Returns:
+            Tuple (pixmap, taille native), ou None si l'image n'est pas en cache
+        """
+        key = self._key(path, max_size)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+        
+    def add(self, path: str, max_size: Optional[QSize], image: QImage, native_size: QSize) -> Tuple[QPixmap, QSize]:
+        """
+        Ajoute au cache une image décodée.
+        
+        Doit être appelé depuis le thread graphique, seul autorisé à créer des pixmaps.
+        
+        Args:
+            path: Chemin du fichier image
+            max_size: Taille maximale utilisée pour le décodage
+            image: Image décodée (nulle si le décodage a échoué)
+            native_size: Taille native de l'image
+            
+        Returns:
+            Tuple (pixmap de l'image, nul si le décodage a échoué ; taille native)
+        """
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            return pixmap, native_size
+        
+        entry = (pixmap, native_size)
+        self._entries[self._key(path, max_size)] = entry
+        self._total_bytes += self._pixmap_bytes(pixmap)
         
-        # Conversion des coordonnées
-        original_x = int(rect.x() * original_width / display_width)
-        original_y = int(rect.y() * original_height / display_height)
-        original_width = int(rect.width() * original_width / display_width)
-        original_height = int(rect.height() * original_height / display_height)
+        # Évincer les entrées les moins récemment utilisées au-delà du budget
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._total_bytes -= self._pixmap_bytes(evicted)
         
-        return QRect(original_x, original_y, original_width, original_height)
+        return entry
+        
+    def get(self, path: str, max_size: Optional[QSize] = None) -> Tuple[QPixmap, QSize]:
+        """
+        Retourne le pixmap d'un fichier, en le décodant seulement si nécessaire.
+        
+        Args:
+            path: Chemin d'un fichier image existant
+            max_size: Taille maximale du décodage (None pour la pleine résolution).
+                Les images plus grandes sont réduites par le décodeur lui-même.
+            
+        Returns:
+            Tuple (pixmap de l'image, nul si le décodage a échoué ;
+            taille native de l'image)
+        """
+        entry = self.lookup(path, max_size)
+        if entry is not None:
+            return entry
+        
+        image, native_size = decode_image(path, max_size)
+        return self.add(path, max_size, image, native_size)
+        
+    def clear(self):
+        """Vide le cache."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+
+# Cache partagé des images décodées
+_PIXMAP_CACHE = PixmapCache()
+
+
+class ScaleWorkerSignals(QObject):
+    """Signaux émis par les tâches de mise à l'échelle en arrière-plan."""
+    
+    finished = pyqtSignal(int, QImage)  # génération, image mise à l'échelle
+
+
+class ScaleWorker(QRunnable):
+    """Tâche de mise à l'échelle lissée d'une image hors du thread graphique."""
+    
+    def __init__(self, signals: ScaleWorkerSignals, generation: int, image: QImage, size: QSize):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.image = image
+        self.size = size
+        
+    def run(self):
+        """Exécute la mise à l'échelle"""
+        scaled = self.image.scaled(
+            self.size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self.signals.finished.emit(self.generation, scaled)
+
+
+class ImageLoadWorkerSignals(QObject):
+    """Signaux émis par les tâches de décodage d'image en arrière-plan."""
+    
+    # jeton, chemin, borne (invalide pour la pleine résolution), image, taille native
+    finished = pyqtSignal(int, str, QSize, QImage, QSize)
+
+
+class ImageLoadWorker(QRunnable):
+    """Tâche de lecture et de décodage d'un fichier image hors du thread graphique."""
+    
+    def __init__(self, signals: ImageLoadWorkerSignals, token: int, path: str, max_size: Optional[QSize]):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.path = path
+        self.max_size = max_size
+        
+    def run(self):
+        """Exécute le décodage"""
+        image, native_size = decode_image(self.path, self.max_size)
+        bound = self.max_size if self.max_size is not None else QSize()
+        self.signals.finished.emit(self.token, self.path, bound, image, native_size)
 
 
 class ImageViewer(QWidget):
@@ -508,6 +970,21 @@ class ImageViewer(QWidget):
     MODE_CREATE = 1  # Mode création
     MODE_EDIT = 2  # Mode édition
     
+    # Délai (ms) de regroupement des crans de molette en un seul zoom
+    ZOOM_DEBOUNCE_MS = 16
+    
+    # Délai (ms) d'inactivité avant le rendu lissé après un zoom interactif
+    SMOOTH_ZOOM_DELAY_MS = 120
+    
+    # Taille (en pixels) à partir de laquelle le rendu lissé est fait en arrière-plan
+    ASYNC_SCALE_MIN_PIXELS = 3840 * 2160
+    
+    # Jeton des décodages anticipés, qui ne sont jamais affichés
+    PREFETCH_TOKEN = -1
+    
+    # Jeton des décodages en pleine résolution de l'image affichée
+    FULL_RESOLUTION_TOKEN = -2
+    
     def __init__(self, parent=None):
         """Initialise le visualiseur d'images."""
         super().__init__(parent)
@@ -518,6 +995,10 @@ class ImageViewer(QWidget):
         # État
         self.image = None  # Image actuelle
         self.original_pixmap = None  # Pixmap original non zoomé
+        self._image_path = None  # Chemin résolu de l'image affichée
+        self._image_data = None  # Contenu encodé de l'image chargée depuis la mémoire
+        self._image_format = None  # Format de ce contenu
+        self._decode_ratio = 1.0  # Largeur décodée / largeur native (< 1 si décodage réduit)
         self.annotations = []  # Annotations à afficher
         self.selected_annotation_index = -1  # Index de l'annotation sélectionnée
         self.scale_factor = 1.0  # Facteur de zoom
@@ -525,6 +1006,34 @@ class ImageViewer(QWidget):
         # État d'édition
         self.edit_mode = self.MODE_VIEW
         
+        # Zoom molette en attente d'application
+        self._pending_zoom_factor = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(self.ZOOM_DEBOUNCE_MS)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+        
+        # Rendu lissé différé une fois le zoom interactif terminé
+        self._smooth_zoom_timer = QTimer(self)
+        self._smooth_zoom_timer.setSingleShot(True)
+        self._smooth_zoom_timer.setInterval(self.SMOOTH_ZOOM_DELAY_MS)
+        self._smooth_zoom_timer.timeout.connect(self._finalize_zoom)
+        
+        # Mise à l'échelle lissée des grandes images en arrière-plan
+        self._original_image = None  # QImage de l'original, utilisable hors thread graphique
+        self._scale_generation = 0  # Incrémenté à chaque rendu pour ignorer les résultats périmés
+        self._pending_scale_key = ""  # Clé QPixmapCache du rendu lissé en cours en arrière-plan
+        self._scale_signals = ScaleWorkerSignals(self)
+        self._scale_signals.finished.connect(self._on_scaled_image_ready)
+        
+        # Décodage des images en arrière-plan
+        self._load_generation = 0  # Incrémenté à chaque chargement pour ignorer les décodages périmés
+        self._full_resolution_pending = False  # Décodage en pleine résolution en cours
+        self._inflight_decodes = set()  # Clés (chemin, borne) des décodages en cours
+        self._pending_load = None  # Clé du décodage attendu par le chargement en cours
+        self._load_signals = ImageLoadWorkerSignals(self)
+        self._load_signals.finished.connect(self._on_image_decoded)
+        
         # Configuration de l'interface
         self._init_ui()
         
@@ -585,19 +1094,8 @@ class ImageViewer(QWidget):
         if not self.original_pixmap:
             return
             
-        # Convertir le rectangle des coordonnées affichées aux coordonnées originales
-        original_rect = self.viewer_widget.convert_to_original_coordinates(rect)
-            
         # Convertir en coordonnées normalisées
-        original_width = self.original_pixmap.width()
-        original_height = self.original_pixmap.height()
-        
-        bbox = BoundingBox(
-            x=max(0, min(1, original_rect.x() / original_width)),
-            y=max(0, min(1, original_rect.y() / original_height)),
-            width=max(0, min(1, original_rect.width() / original_width)),
-            height=max(0, min(1, original_rect.height() / original_height))
-        )
+        bbox = self.viewer_widget.rect_to_bbox(rect)
         
         # Émettre le signal
         self.annotation_created.emit(bbox)
@@ -607,32 +1105,27 @@ class ImageViewer(QWidget):
         if not self.original_pixmap or index < 0 or index >= len(self.annotations):
             return
             
-        # Convertir le rectangle des coordonnées affichées aux coordonnées originales
-        original_rect = self.viewer_widget.convert_to_original_coordinates(rect)
-            
         # Convertir en coordonnées normalisées
-        original_width = self.original_pixmap.width()
-        original_height = self.original_pixmap.height()
-        
-        bbox = BoundingBox(
-            x=max(0, min(1, original_rect.x() / original_width)),
-            y=max(0, min(1, original_rect.y() / original_height)),
-            width=max(0, min(1, original_rect.width() / original_width)),
-            height=max(0, min(1, original_rect.height() / original_height))
-        )
+        bbox = self.viewer_widget.rect_to_bbox(rect)
         
         # Émettre le signal
         self.annotation_modified.emit(index, bbox)
     
     def wheelEvent(self, event: QWheelEvent):
         """Gère le zoom avec la molette de la souris"""
-        if event.angleDelta().y() > 0:
-            self.zoom_in()
-        else:
-            self.zoom_out()
+        # Cumuler les crans pour n'appliquer qu'un seul redimensionnement
+        self._pending_zoom_factor *= 1.25 if event.angleDelta().y() > 0 else 0.8
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
         
         event.accept()
     
+    def _apply_pending_zoom(self):
+        """Applique en une fois le zoom cumulé par la molette."""
+        factor = self._pending_zoom_factor
+        self._pending_zoom_factor = 1.0
+        self.scale_image(factor, interactive=True)
+    
     def zoom_in(self):
         """Zoom avant"""
         self.scale_image(1.25)
@@ -647,96 +1140,327 @@ class ImageViewer(QWidget):
             reset_factor = 1.0 / self.scale_factor
             self.scale_image(reset_factor)
     
-    def scale_image(self, factor):
-        """Met à l'échelle l'image"""
+    def scale_image(self, factor, interactive: bool = False):
+        """
+        Met à l'échelle l'image
+        
+        Args:
+            factor: Facteur multiplicatif appliqué au zoom actuel
+            interactive: True pendant un zoom continu (molette): rendu rapide,
+                puis rendu lissé une fois l'utilisateur inactif
+        """
         if not self.original_pixmap:
             return
         
         # Mettre à jour le facteur d'échelle
+        previous_factor = self.scale_factor
         self.scale_factor *= factor
         self.scale_factor = max(0.1, min(10.0, self.scale_factor))
         
+        # Absorber l'erreur d'arrondi (ex: réinitialisation du zoom)
+        if abs(self.scale_factor - 1.0) < 1e-9:
+            self.scale_factor = 1.0
+        
+        # Zoom déjà en butée: rien à redessiner
+        if self.scale_factor == previous_factor:
+            return
+        
+        # Au-delà de 100% sur une image décodée réduite, passer à la pleine résolution
+        if self.scale_factor > 1.0 and self._decode_ratio < 1.0:
+            self._load_full_resolution()
+        
+        if interactive:
+            self._render_scaled(Qt.TransformationMode.FastTransformation)
+            self._smooth_zoom_timer.start()
+        else:
+            self._smooth_zoom_timer.stop()
+            self._render_scaled(Qt.TransformationMode.SmoothTransformation)
+        
+        # Mettre à jour l'info
+        self.info_label.setText(f"Zoom: {self.scale_factor * self._decode_ratio * 100:.0f}%")
+    
+    def _load_full_resolution(self):
+        """
+        Remplace l'image décodée réduite par sa version pleine résolution.
+        
+        Une image lue depuis un fichier est décodée en arrière-plan: la version
+        réduite reste affichée, agrandie, jusqu'à l'arrivée du résultat.
+        """
+        if self._image_data is not None:
+            # Contenu déjà en mémoire: pas de lecture de fichier
+            image, _ = decode_image(self._image_data, fmt=self._image_format)
+            self._apply_full_resolution(QPixmap.fromImage(image))
+            return
+        
+        if self._full_resolution_pending:
+            return
+        
+        try:
+            entry = _PIXMAP_CACHE.lookup(self._image_path)
+        except OSError as e:
+            self.logger.warning(f"Échec du chargement en pleine résolution: {e}")
+            return
+        
+        if entry is not None:
+            self._apply_full_resolution(entry[0])
+            return
+        
+        self._full_resolution_pending = True
+        self._start_decode(self.FULL_RESOLUTION_TOKEN, self._image_path, None)
+    
+    def _apply_full_resolution(self, pixmap: QPixmap):
+        """
+        Installe la version pleine résolution de l'image affichée.
+        
+        Le facteur de zoom est ajusté pour que la taille affichée ne change pas.
+        
+        Args:
+            pixmap: Pixmap pleine résolution
+        """
+        if pixmap.isNull():
+            return
+        
+        self.scale_factor *= self._decode_ratio
+        self._decode_ratio = 1.0
+        self._set_original_pixmap(pixmap)
+    
+    def _set_original_pixmap(self, pixmap: QPixmap):
+        """
+        Définit le pixmap original et prépare sa mise à l'échelle.
+        
+        Args:
+            pixmap: Pixmap décodé de l'image
+        """
+        self.original_pixmap = pixmap
+        
+        # Conserver une QImage des grandes images pour la mise à l'échelle en arrière-plan
+        self._scale_generation += 1
+        if pixmap.width() * pixmap.height() >= self.ASYNC_SCALE_MIN_PIXELS:
+            self._original_image = pixmap.toImage()
+        else:
+            self._original_image = None
+    
+    def _release_original(self):
+        """Oublie le pixmap original et annule les mises à l'échelle en cours."""
+        self.original_pixmap = None
+        self._image_path = None
+        self._image_data = None
+        self._image_format = None
+        self._decode_ratio = 1.0
+        self._full_resolution_pending = False
+        self._original_image = None
+        self._scale_generation += 1
+    
+    def _decode_bound(self) -> QSize:
+        """
+        Calcule la taille maximale de décodage d'une image.
+        
+        Returns:
+            Deux fois la taille de l'écran en pixels physiques ; au-delà,
+            la pleine résolution n'est chargée qu'en zoomant
+        """
+        screen = self.screen()
+        if screen is None:
+            return QSize(7680, 4320)
+        return screen.size() * (2 * screen.devicePixelRatio())
+    
+    def _finalize_zoom(self):
+        """Refait le rendu lissé de l'image au zoom actuel."""
+        if self.original_pixmap:
+            self._render_scaled(Qt.TransformationMode.SmoothTransformation)
+    
+    def _render_scaled(self, mode: Qt.TransformationMode):
+        """
+        Affiche l'image mise à l'échelle au zoom actuel.
+        
+        Args:
+            mode: Mode de transformation utilisé pour le redimensionnement
+        """
+        self._scale_generation += 1
+        
+        # À 100%, l'original est affiché tel quel, sans copie mise à l'échelle
+        if self.scale_factor == 1.0:
+            self.viewer_widget.set_pixmap(self.original_pixmap, None, self.scale_factor)
+            return
+        
+        # Taille cible en pixels physiques pour un rendu net sur écran HiDPI
+        ratio = self.devicePixelRatioF()
+        target_size = self.original_pixmap.size() * (self.scale_factor * ratio)
+        
+        # Rendu lissé déjà calculé pour ce niveau de zoom
+        cache_key = f"{self.original_pixmap.cacheKey()}@{target_size.width()}x{target_size.height()}"
+        scaled_pixmap = QPixmapCache.find(cache_key)
+        if scaled_pixmap is not None and not scaled_pixmap.isNull():
+            self.viewer_widget.set_pixmap(self.original_pixmap, scaled_pixmap, self.scale_factor)
+            return
+        
+        # Grandes images: aperçu rapide immédiat, rendu lissé dans un thread de travail
+        if (mode == Qt.TransformationMode.SmoothTransformation
+                and self._original_image is not None):
+            mode = Qt.TransformationMode.FastTransformation
+            self._pending_scale_key = cache_key
+            QThreadPool.globalInstance().start(
+                ScaleWorker(self._scale_signals, self._scale_generation, self._original_image, target_size)
+            )
+        
         # Créer une version mise à l'échelle du pixmap
         scaled_pixmap = self.original_pixmap.scaled(
-            self.original_pixmap.size() * self.scale_factor,
+            target_size,
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
+            mode
         )
+        scaled_pixmap.setDevicePixelRatio(ratio)
+        
+        # Seuls les rendus lissés sont conservés pour un retour à ce niveau de zoom
+        if mode == Qt.TransformationMode.SmoothTransformation:
+            QPixmapCache.insert(cache_key, scaled_pixmap)
         
         # Mettre à jour l'image
         self.viewer_widget.set_pixmap(self.original_pixmap, scaled_pixmap, self.scale_factor)
+    
+    def _on_scaled_image_ready(self, generation: int, image: QImage):
+        """
+        Affiche le résultat d'une mise à l'échelle en arrière-plan.
         
-        # Mettre à jour l'info
-        self.info_label.setText(f"Zoom: {self.scale_factor * 100:.0f}%")
+        Args:
+            generation: Génération du rendu ayant lancé la tâche
+            image: Image mise à l'échelle
+        """
+        # Ignorer les résultats dépassés par un zoom ou un chargement plus récent
+        if generation != self._scale_generation or not self.original_pixmap:
+            return
+        
+        scaled_pixmap = QPixmap.fromImage(image)
+        scaled_pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        QPixmapCache.insert(self._pending_scale_key, scaled_pixmap)
+        self.viewer_widget.set_pixmap(self.original_pixmap, scaled_pixmap, self.scale_factor)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _resolve_image_path(raw: str) -> str:
+        """
+        Résout le chemin local d'une image.
+        
+        Les chemins de type URL sont ramenés à leur partie locale, puis
+        recherchés dans les dossiers de données connus.
+        
+        Args:
+            raw: Chemin brut de l'image
+            
+        Returns:
+            Chemin d'un fichier existant
+            
+        Raises:
+            FileNotFoundError: Si aucun fichier ne correspond. Les exceptions
+                n'étant pas mises en cache, un fichier apparu entre-temps
+                (téléchargement) sera trouvé au prochain appel.
+        """
+        # Correction pour les chemins problématiques
+        if raw.startswith(('http://', 'https://')):
+            # Extraire la partie locale du chemin (après http:// ou https://)
+            local_part = raw.split('://')[-1]
+            
+            # Vérifier si le chemin local existe
+            if Path(local_part).exists():
+                return local_part
+            
+            # Essayer d'autres variations de chemins, recherchées dans le contenu
+            # mis en cache des dossiers candidats plutôt que fichier par fichier.
+            # Un listing est relu dès que la date de modification du dossier change.
+            normalized = local_part.replace('\\', '/')
+            filename = os.path.basename(local_part)
+            candidates = (
+                (os.path.join("data/datasets", os.path.dirname(local_part)), filename),
+                (os.path.dirname(normalized), os.path.basename(normalized)),
+                ("data/downloads", filename),
+                ("downloads", filename),
+            )
+            
+            resolved = next(
+                (found for found in (_scan_dir(d).get(_name_key(n)) for d, n in candidates) if found),
+                None
+            )
+            if resolved is None:
+                raise FileNotFoundError(raw)
+            return resolved
+        
+        # Vérifier si le fichier existe
+        if not Path(raw).exists():
+            raise FileNotFoundError(raw)
+        
+        return raw
+    
+    @staticmethod
+    def forget_resolved_paths():
+        """
+        Oublie les chemins d'images résolus.
+        
+        À appeler quand des fichiers ont pu être déplacés, supprimés ou
+        téléchargés (changement de dataset, import, suppression).
+        """
+        ImageViewer._resolve_image_path.cache_clear()
     
     def load_image(self, image: Image) -> bool:
-        """Charge une image dans le visualiseur"""
+        """
+        Charge une image dans le visualiseur.
+        
+        Une image absente du cache est décodée en arrière-plan ; image_loaded
+        est émis une fois le pixmap installé.
+        
+        Args:
+            image: Image à afficher
+            
+        Returns:
+            True si l'image est affichée ou en cours de décodage
+        """
         self.image = image
+        self._load_generation += 1
+        self._pending_load = None
         
         try:
             # S'assurer que le chemin est une chaîne pour QPixmap
             path_str = str(image.path) if image.path is not None else ""
             
-            self.logger.debug(f"Chargement de l'image: {path_str}, type: {type(image.path)}")
+            if self.logger.is_debug_enabled():
+                self.logger.debug(f"Chargement de l'image: {path_str}, type: {type(image.path)}")
             
-            # Correction pour les chemins problématiques
-            if path_str.startswith(('http://', 'https://')):
-                # Extraire la partie locale du chemin (après http:// ou https://)
-                local_part = path_str.split('://')[-1]
-                
-                # Vérifier si le chemin local existe
-                if Path(local_part).exists():
-                    path_str = local_part
-                    self.logger.debug(f"Chemin corrigé pour l'image URL: {path_str}")
-                else:
-                    # Essayer d'autres variations de chemins
-                    filename = Path(local_part).name
-                    potential_paths = [
-                        Path("data/datasets") / Path(local_part),
-                        Path(local_part.replace('\\', '/')),
-                        Path("data/downloads") / filename,
-                        Path("downloads") / filename
-                    ]
-                    
-                    for potential_path in potential_paths:
-                        if potential_path.exists():
-                            path_str = str(potential_path)
-                            self.logger.debug(f"Chemin alternatif trouvé: {path_str}")
-                            break
-                    else:
-                        self.logger.error(f"Fichier image introuvable: {path_str}")
-                        self.image_loaded.emit(False)
-                        return False
-            
-            # Vérifier si le fichier existe
-            if not Path(path_str).exists():
+            # Résoudre le chemin local (résultat mis en cache par chemin brut)
+            try:
+                resolved_path = self._resolve_image_path(path_str)
+            except FileNotFoundError:
                 self.logger.error(f"Fichier image introuvable: {path_str}")
                 self.image_loaded.emit(False)
                 return False
             
-            # Charger le pixmap avec la chaîne
-            self.original_pixmap = QPixmap(path_str)
-            
-            if self.original_pixmap.isNull():
-                self.logger.error(f"Échec du chargement de l'image (pixmap null): {path_str}")
-                self.image_loaded.emit(False)
-                return False
-                
-            # Afficher l'image
-            self.viewer_widget.set_pixmap(self.original_pixmap)
-            
-            # Réinitialiser le zoom
-            self.scale_factor = 1.0
-            
-            # Charger les annotations
-            self.annotations = image.annotations
-            self.viewer_widget.set_annotations(self.annotations)
+            if resolved_path != path_str:
+                if self.logger.is_debug_enabled():
+                    self.logger.debug(f"Chemin corrigé pour l'image: {resolved_path}")
+                path_str = resolved_path
             
             # Réinitialiser l'état d'édition
             self.edit_mode = self.MODE_VIEW
             self.viewer_widget.set_edit_mode(self.MODE_VIEW)
             
-            self.image_loaded.emit(True)
+            # Image déjà décodée: affichage immédiat. L'image est réduite dès
+            # le décodage si elle dépasse largement la taille de l'écran.
+            bound = self._decode_bound()
+            entry = _PIXMAP_CACHE.lookup(path_str, bound)
+            if entry is not None:
+                return self._install_pixmap(path_str, *entry)
+            
+            # Sinon, lire et décoder le fichier hors du thread graphique. L'image
+            # précédente et ses annotations sont retirées en attendant: les
+            # annotations de la nouvelle image ne sont installées qu'avec son pixmap.
+            self._release_original()
+            self.annotations = []
+            self.selected_annotation_index = -1
+            self.viewer_widget.set_annotations([])
+            self.viewer_widget.clear_pixmap()
+            
+            # Une lecture anticipée de la même image déjà en cours est adoptée
+            # plutôt que de décoder le fichier une seconde fois
+            self._pending_load = self._decode_key(path_str, bound)
+            self._start_decode(self._load_generation, path_str, bound)
             return True
             
         except Exception as e:
@@ -744,6 +1468,166 @@ class ImageViewer(QWidget):
             self.image_loaded.emit(False)
             return False
     
+    def load_image_from_bytes(self, image: Image, data: bytes, fmt: Optional[str] = None) -> bool:
+        """
+        Charge une image déjà présente en mémoire (téléchargement, blob), sans
+        l'écrire puis la relire sur disque.
+        
+        Args:
+            image: Image à afficher (annotations)
+            data: Contenu encodé de l'image
+            fmt: Format de l'image (ex: "jpg"), deviné à partir du contenu si absent
+            
+        Returns:
+            True si l'image a été affichée
+        """
+        self.image = image
+        self._load_generation += 1
+        self._pending_load = None
+        
+        self.edit_mode = self.MODE_VIEW
+        self.viewer_widget.set_edit_mode(self.MODE_VIEW)
+        
+        decoded, native_size = decode_image(data, self._decode_bound(), fmt)
+        
+        # Le contenu est conservé pour un éventuel passage en pleine résolution
+        return self._install_pixmap(None, QPixmap.fromImage(decoded), native_size, data, fmt)
+    
+    def prefetch_image(self, image: Image):
+        """
+        Décode une image en arrière-plan pour un affichage ultérieur immédiat.
+        
+        Args:
+            image: Image susceptible d'être affichée prochainement
+        """
+        path_str = str(image.path) if image.path is not None else ""
+        
+        try:
+            path_str = self._resolve_image_path(path_str)
+            bound = self._decode_bound()
+            if _PIXMAP_CACHE.lookup(path_str, bound) is not None:
+                return
+        except OSError:
+            return
+        
+        # Priorité basse: le chargement de l'image affichée passe avant
+        self._start_decode(self.PREFETCH_TOKEN, path_str, bound, -1)
+    
+    @staticmethod
+    def _decode_key(path: str, max_size: Optional[QSize]) -> tuple:
+        """
+        Construit la clé d'un décodage en arrière-plan.
+        
+        Args:
+            path: Chemin résolu de l'image
+            max_size: Taille maximale du décodage (None pour la pleine résolution)
+            
+        Returns:
+            Tuple (chemin, borne)
+        """
+        return (path, (max_size.width(), max_size.height()) if max_size is not None else None)
+    
+    def _start_decode(self, token: int, path: str, max_size: Optional[QSize], priority: int = 0):
+        """
+        Lance le décodage d'une image en arrière-plan, sauf s'il est déjà en cours.
+        
+        Args:
+            token: Jeton transmis avec le résultat
+            path: Chemin résolu de l'image
+            max_size: Taille maximale du décodage (None pour la pleine résolution)
+            priority: Priorité de la tâche dans le pool de threads
+        """
+        key = self._decode_key(path, max_size)
+        if key in self._inflight_decodes:
+            return
+        
+        self._inflight_decodes.add(key)
+        QThreadPool.globalInstance().start(
+            ImageLoadWorker(self._load_signals, token, path, max_size),
+            priority
+        )
+    
+    def _on_image_decoded(self, token: int, path: str, bound: QSize, image: QImage, native_size: QSize):
+        """
+        Reçoit le résultat d'un décodage en arrière-plan.
+        
+        Args:
+            token: Génération du chargement ayant lancé la tâche (ou jeton dédié)
+            path: Chemin de l'image décodée
+            bound: Taille maximale utilisée pour le décodage (invalide pour la pleine résolution)
+            image: Image décodée (nulle en cas d'échec)
+            native_size: Taille native de l'image
+        """
+        max_size = bound if bound.isValid() else None
+        key = self._decode_key(path, max_size)
+        self._inflight_decodes.discard(key)
+        
+        try:
+            entry = _PIXMAP_CACHE.add(path, max_size, image, native_size)
+        except OSError:
+            # Fichier supprimé entre-temps: afficher sans mettre en cache
+            entry = (QPixmap.fromImage(image), native_size)
+        
+        if token == self.FULL_RESOLUTION_TOKEN:
+            # Ne remplacer que l'image encore affichée en version réduite
+            if path != self._image_path:
+                return
+            self._full_resolution_pending = False
+            if self._decode_ratio < 1.0 and not entry[0].isNull():
+                self._apply_full_resolution(entry[0])
+                self._render_scaled(Qt.TransformationMode.FastTransformation)
+                self._smooth_zoom_timer.start()
+            return
+        
+        # N'installer que le décodage attendu par le chargement en cours, qu'il ait
+        # été lancé par ce chargement ou par une lecture anticipée adoptée
+        if key != self._pending_load:
+            return
+        
+        self._pending_load = None
+        self._install_pixmap(path, *entry)
+    
+    def _install_pixmap(self, path: str, pixmap: QPixmap, native_size: QSize,
+                        data: Optional[bytes] = None, fmt: Optional[str] = None) -> bool:
+        """
+        Affiche une image décodée avec ses annotations.
+        
+        Args:
+            path: Chemin résolu de l'image (None pour une image chargée depuis la mémoire)
+            pixmap: Pixmap décodé
+            native_size: Taille native de l'image
+            data: Contenu encodé d'une image chargée depuis la mémoire
+            fmt: Format de ce contenu
+            
+        Returns:
+            True si l'image a été affichée
+        """
+        if pixmap.isNull():
+            self.logger.error(f"Échec du chargement de l'image (pixmap null): {path or 'données en mémoire'}")
+            self.image_loaded.emit(False)
+            return False
+        
+        self._image_path = path
+        self._image_data = data
+        self._image_format = fmt
+        self._full_resolution_pending = False
+        self._decode_ratio = pixmap.width() / native_size.width() if native_size.width() > 0 else 1.0
+        self._set_original_pixmap(pixmap)
+        
+        # Afficher l'image
+        self.viewer_widget.set_pixmap(self.original_pixmap)
+        
+        # Réinitialiser le zoom
+        self.scale_factor = 1.0
+        
+        # Charger les annotations, en même temps que l'image à laquelle elles se rapportent
+        self.annotations = self.image.annotations if self.image else []
+        self.selected_annotation_index = -1
+        self.viewer_widget.set_annotations(self.annotations)
+        
+        self.image_loaded.emit(True)
+        return True
+    
     def set_annotations(self, annotations: List[Annotation]):
         """Définit les annotations à afficher"""
         self.annotations = annotations
@@ -759,12 +1643,17 @@ class ImageViewer(QWidget):
     def clear_image(self):
         """Efface l'image et les annotations"""
         self.image = None
-        self.original_pixmap = None
+        self._load_generation += 1
+        self._pending_load = None
+        self._release_original()
         self.annotations = []
         self.selected_annotation_index = -1
-        self.viewer_widget.set_pixmap(None)
+        self.viewer_widget.clear_pixmap()
         self.viewer_widget.set_annotations([])
         
+        # Les fichiers ont pu changer depuis la résolution de leurs chemins
+        self.forget_resolved_paths()
+        
     def set_edit_mode(self, mode: int):
         """Définit le mode d'édition"""
         self.edit_mode = mode
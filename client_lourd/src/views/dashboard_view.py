@@ -3,9 +3,9 @@
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QGroupBox, QGridLayout, QScrollArea, QWidget,
-    QListWidget, QListWidgetItem, QFrame, QMenu, QMessageBox
+    QListView, QFrame, QMenu, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QFont, QPalette
 from typing import Optional, List, Dict
 
@@ -13,6 +13,157 @@ from src.views.base_view import BaseView
 from src.utils.i18n import get_translation_manager, tr
 from src.controllers.controller_manager import ControllerManager
 
+# Feuilles de style partagées, analysées une seule fois par Qt pour des chaînes identiques
+_GROUPBOX_QSS = """
+    QGroupBox {
+        font-weight: bold;
+        font-size: 12px;
+        border: 1px solid palette(mid);
+        border-radius: 4px;
+        margin: 5px 0;
+        padding-top: 8px;
+        color: palette(text);
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 8px;
+        padding: 0 4px 0 4px;
+        color: palette(text);
+    }
+"""
+
+_STAT_FRAME_QSS = """
+    QFrame {
+        border: 1px solid palette(mid);
+        border-radius: 4px;
+        padding: 8px;
+        background-color: palette(button);
+    }
+"""
+
+_BUTTON_QSS = """
+    QPushButton {
+        border: 1px solid palette(mid);
+        border-radius: 4px;
+        padding: 10px;
+        font-size: 12px;
+        background-color: palette(button);
+        color: palette(button-text);
+    }
+    QPushButton:hover {
+        background-color: palette(light);
+    }
+    QPushButton:pressed {
+        background-color: palette(dark);
+    }
+"""
+
+_SMALL_BUTTON_QSS = """
+    QPushButton {
+        border: 1px solid palette(mid);
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 11px;
+        background-color: palette(button);
+        color: palette(button-text);
+    }
+    QPushButton:hover {
+        background-color: palette(light);
+    }
+"""
+
+_LIST_QSS = """
+    QListView {
+        border: 1px solid palette(mid);
+        border-radius: 4px;
+        background-color: palette(base);
+        color: palette(text);
+    }
+    QListView::item {
+        padding: 8px;
+        border-bottom: 1px solid palette(mid);
+    }
+    QListView::item:selected {
+        background-color: palette(highlight);
+        color: palette(highlighted-text);
+    }
+    QListView::item:hover {
+        background-color: palette(light);
+    }
+"""
+
+
+class DatasetsModel(QAbstractListModel):
+    """
+    Modèle de la liste des datasets du tableau de bord.
+    
+    Chaque ligne est un tuple (nom, nombre d'images, nombre d'annotations) ;
+    le texte affiché n'est formaté que pour les lignes visibles.
+    """
+    
+    def __init__(self, item_format: str, parent=None):
+        """
+        Initialise le modèle.
+        
+        Args:
+            item_format: Format traduit d'une entrée ({0}: nom, {1}: images, {2}: annotations)
+            parent: Objet parent
+        """
+        super().__init__(parent)
+        self._rows = ()
+        self._item_format = item_format
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Retourne le nombre de datasets."""
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Retourne la donnée d'une ligne pour un rôle.
+        
+        Args:
+            index: Index de la ligne
+            role: Rôle demandé (texte affiché, ou nom du dataset pour UserRole)
+            
+        Returns:
+            Donnée demandée, ou None pour les autres rôles
+        """
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._item_format.format(*row)
+        if role == Qt.ItemDataRole.UserRole:
+            return row[0]
+        return None
+        
+    def set_rows(self, rows: tuple):
+        """
+        Remplace toutes les lignes en une seule réinitialisation du modèle.
+        
+        Args:
+            rows: Tuples (nom, nombre d'images, nombre d'annotations)
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def set_item_format(self, item_format: str):
+        """
+        Change le format des entrées (changement de langue).
+        
+        Args:
+            item_format: Nouveau format traduit
+        """
+        self._item_format = item_format
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._rows) - 1),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+
+
 class DashboardView(BaseView):
     """
     Vue du tableau de bord principal.
@@ -24,13 +175,26 @@ class DashboardView(BaseView):
     create_dataset_requested = pyqtSignal()  # Demande de création de dataset
     import_requested = pyqtSignal()  # Demande d'import
     
+    # Délai (ms) de regroupement des demandes d'actualisation successives
+    REFRESH_DEBOUNCE_MS = 50
+    
     def __init__(self, parent=None, controller_manager: Optional[ControllerManager] = None):
         """Initialise la vue du tableau de bord."""
         super().__init__(parent, controller_manager)
         self.stats_labels = {}
+        self.stats_caption_labels = {}
+        self._stat_label_keys = ()
         self.datasets_list = None
+        self._datasets_snapshot = None  # Contenu affiché dans la liste des datasets
+        self._first_show = True  # Statistiques chargées au premier affichage
+        
+        # Actualisation différée: une rafale de demandes ne provoque qu'une requête
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh_stats)
+        
         self._init_ui()
-        self.refresh_stats()
         
     def _init_ui(self):
         """Initialise l'interface utilisateur."""
@@ -71,51 +235,36 @@ class DashboardView(BaseView):
         scroll_area.setStyleSheet("QScrollArea { border: none; }")
         layout.addWidget(scroll_area)
         
+    def showEvent(self, event):
+        """
+        Charge les statistiques au premier affichage de la vue.
+        
+        Le chargement est différé après le premier rendu de la fenêtre, afin
+        que la requête au contrôleur ne retarde pas son affichage.
+        """
+        super().showEvent(event)
+        if self._first_show:
+            self._first_show = False
+            self.refresh_stats()
+        
     def _create_stats_section(self, layout):
         """Crée la section des statistiques."""
         stats_group = QGroupBox(tr("view.dashboard.statistics"))
-        stats_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                margin: 5px 0;
-                padding-top: 8px;
-                color: palette(text);
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-                color: palette(text);
-            }
-        """)
+        stats_group.setStyleSheet(_GROUPBOX_QSS)
         
         stats_layout = QGridLayout()
         stats_layout.setSpacing(15)
         
         # Statistiques sobres
         self.stats_labels = {}
-        stats_items = [
-            ("total_datasets", tr("view.dashboard.total_datasets")),
-            ("total_images", tr("view.dashboard.total_images")),
-            ("total_annotations", tr("view.dashboard.total_annotations")),
-            ("storage_used", tr("view.dashboard.storage_used"))
-        ]
-        
-        for i, (key, label) in enumerate(stats_items):
+        self.stats_caption_labels = {}
+        stats_keys = ("total_datasets", "total_images", "total_annotations", "storage_used")
+        
+        for i, key in enumerate(stats_keys):
             # Conteneur sobre pour chaque statistique
             stat_frame = QFrame()
             stat_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-            stat_frame.setStyleSheet("""
-                QFrame {
-                    border: 1px solid palette(mid);
-                    border-radius: 4px;
-                    padding: 8px;
-                    background-color: palette(button);
-                }
-            """)
+            stat_frame.setStyleSheet(_STAT_FRAME_QSS)
             stat_layout = QVBoxLayout(stat_frame)
             
             # Valeur
@@ -125,9 +274,10 @@ class DashboardView(BaseView):
             self.stats_labels[key] = value_widget
             
             # Label
-            label_widget = QLabel(label)
+            label_widget = QLabel(tr(f"view.dashboard.{key}"))
             label_widget.setStyleSheet("font-size: 11px; color: palette(text);")
             label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.stats_caption_labels[key] = label_widget
             
             stat_layout.addWidget(value_widget)
             stat_layout.addWidget(label_widget)
@@ -135,61 +285,30 @@ class DashboardView(BaseView):
             row, col = i // 2, i % 2
             stats_layout.addWidget(stat_frame, row, col)
         
+        self._stat_label_keys = tuple(self.stats_labels)
+        
         stats_group.setLayout(stats_layout)
         layout.addWidget(stats_group)
         
     def _create_quick_actions_section(self, layout):
         """Crée la section des actions rapides."""
         actions_group = QGroupBox(tr("view.dashboard.quick_actions"))
-        actions_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                margin: 5px 0;
-                padding-top: 8px;
-                color: palette(text);
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-                color: palette(text);
-            }
-        """)
+        actions_group.setStyleSheet(_GROUPBOX_QSS)
         
         actions_layout = QHBoxLayout()
         actions_layout.setSpacing(15)
         
         # Boutons d'action sobres avec thème
-        button_style = """
-            QPushButton {
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 10px;
-                font-size: 12px;
-                background-color: palette(button);
-                color: palette(button-text);
-            }
-            QPushButton:hover {
-                background-color: palette(light);
-            }
-            QPushButton:pressed {
-                background-color: palette(dark);
-            }
-        """
-        
         self.create_btn = QPushButton(tr("view.dashboard.create_dataset"))
-        self.create_btn.setStyleSheet(button_style)
+        self.create_btn.setStyleSheet(_BUTTON_QSS)
         self.create_btn.clicked.connect(self.create_dataset_requested.emit)
         
         self.import_btn = QPushButton(tr("view.dashboard.import_data"))
-        self.import_btn.setStyleSheet(button_style)
+        self.import_btn.setStyleSheet(_BUTTON_QSS)
         self.import_btn.clicked.connect(self.import_requested.emit)
         
         self.open_btn = QPushButton(tr("view.dashboard.open_dataset"))
-        self.open_btn.setStyleSheet(button_style)
+        self.open_btn.setStyleSheet(_BUTTON_QSS)
         self.open_btn.clicked.connect(self._on_open_dataset)
         
         actions_layout.addWidget(self.create_btn)
@@ -202,87 +321,38 @@ class DashboardView(BaseView):
     def _create_datasets_management_section(self, layout):
         """Crée la section de gestion des datasets."""
         datasets_group = QGroupBox(tr("view.dashboard.datasets_management"))
-        datasets_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                margin: 5px 0;
-                padding-top: 8px;
-                color: palette(text);
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 4px 0 4px;
-                color: palette(text);
-            }
-        """)
+        datasets_group.setStyleSheet(_GROUPBOX_QSS)
         
         datasets_layout = QVBoxLayout()
         
         # Liste des datasets existants
-        self.datasets_list = QListWidget()
+        self._datasets_model = DatasetsModel(tr("view.dashboard.dataset_item"), self)
+        self.datasets_list = QListView()
+        self.datasets_list.setModel(self._datasets_model)
+        self.datasets_list.setUniformItemSizes(True)
+        self.datasets_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.datasets_list.setMaximumHeight(200)
-        self.datasets_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                background-color: palette(base);
-                color: palette(text);
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid palette(mid);
-            }
-            QListWidget::item:selected {
-                background-color: palette(highlight);
-                color: palette(highlighted-text);
-            }
-            QListWidget::item:hover {
-                background-color: palette(light);
-            }
-        """)
-        self.datasets_list.itemDoubleClicked.connect(self._on_dataset_double_clicked)
+        self.datasets_list.setStyleSheet(_LIST_QSS)
+        self.datasets_list.doubleClicked.connect(self._on_dataset_double_clicked)
         self.datasets_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.datasets_list.customContextMenuRequested.connect(self._on_dataset_context_menu)
         
+        # Menu contextuel construit une seule fois et réutilisé à chaque clic droit
+        self._ctx_menu = QMenu(self.datasets_list)
+        self._ctx_open = self._ctx_menu.addAction(tr("view.dashboard.open_dataset"))
+        self._ctx_delete = self._ctx_menu.addAction(tr("view.dashboard.delete_dataset"))
+        
         datasets_layout.addWidget(self.datasets_list)
         
         # Boutons de gestion
         buttons_layout = QHBoxLayout()
         
         refresh_btn = QPushButton(tr("view.dashboard.refresh"))
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 11px;
-                background-color: palette(button);
-                color: palette(button-text);
-            }
-            QPushButton:hover {
-                background-color: palette(light);
-            }
-        """)
+        refresh_btn.setStyleSheet(_SMALL_BUTTON_QSS)
         refresh_btn.clicked.connect(self.refresh_stats)
         
         delete_btn = QPushButton(tr("view.dashboard.delete_dataset"))
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                border: 1px solid palette(mid);
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 11px;
-                background-color: palette(button);
-                color: palette(button-text);
-            }
-            QPushButton:hover {
-                background-color: palette(light);
-            }
-        """)
+        delete_btn.setStyleSheet(_SMALL_BUTTON_QSS)
         delete_btn.clicked.connect(self._on_delete_selected_dataset)
         
         buttons_layout.addWidget(refresh_btn)
@@ -326,31 +396,26 @@ class DashboardView(BaseView):
     
     def _on_dataset_context_menu(self, position):
         """Affiche le menu contextuel pour un dataset."""
-        item = self.datasets_list.itemAt(position)
-        if not item:
+        index = self.datasets_list.indexAt(position)
+        if not index.isValid():
             return
             
-        menu = QMenu()
-        
-        open_action = menu.addAction(tr("view.dashboard.open_dataset"))
-        delete_action = menu.addAction(tr("view.dashboard.delete_dataset"))
+        action = self._ctx_menu.exec(self.datasets_list.mapToGlobal(position))
         
-        action = menu.exec(self.datasets_list.mapToGlobal(position))
-        
-        if action == open_action:
-            dataset_name = item.text().split(' - ')[0]
+        dataset_name = index.data(Qt.ItemDataRole.UserRole)
+        if action == self._ctx_open:
             self.dataset_requested.emit(dataset_name)
-        elif action == delete_action:
-            self._delete_dataset(item.text().split(' - ')[0])
+        elif action == self._ctx_delete:
+            self._delete_dataset(dataset_name)
     
     def _on_delete_selected_dataset(self):
         """Supprime le dataset sélectionné."""
-        current_item = self.datasets_list.currentItem()
-        if not current_item:
+        current_index = self.datasets_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.information(self, tr("view.dashboard.info"), tr("view.dashboard.select_dataset_to_delete"))
             return
             
-        dataset_name = current_item.text().split(' - ')[0]
+        dataset_name = current_index.data(Qt.ItemDataRole.UserRole)
         self._delete_dataset(dataset_name)
     
     def _delete_dataset(self, dataset_name):
@@ -384,9 +449,9 @@ class DashboardView(BaseView):
                     tr("view.dashboard.delete_error", str(e))
                 )
         
-    def _on_dataset_double_clicked(self, item):
+    def _on_dataset_double_clicked(self, index: QModelIndex):
         """Gère le double-clic sur un dataset récent."""
-        dataset_name = item.text().split(' - ')[0]  # Récupérer le nom du dataset
+        dataset_name = index.data(Qt.ItemDataRole.UserRole)  # Récupérer le nom du dataset
         self.dataset_requested.emit(dataset_name)
         
     def _on_language_changed(self, language_code: str):
@@ -400,24 +465,35 @@ class DashboardView(BaseView):
             self.open_btn.setText(tr("view.dashboard.open_dataset"))
         if hasattr(self, 'no_datasets_label'):
             self.no_datasets_label.setText(tr("view.dashboard.no_datasets"))
+        if hasattr(self, '_ctx_menu'):
+            self._ctx_open.setText(tr("view.dashboard.open_dataset"))
+            self._ctx_delete.setText(tr("view.dashboard.delete_dataset"))
+        for key, label_widget in self.stats_caption_labels.items():
+            label_widget.setText(tr(f"view.dashboard.{key}"))
         
-        # Actualiser les statistiques pour mettre à jour les labels
-        self.refresh_stats()
+        # Retraduire les entrées de la liste sans interroger à nouveau le contrôleur
+        if self.datasets_list is not None:
+            self._datasets_model.set_item_format(tr("view.dashboard.dataset_item"))
         
     def refresh_stats(self):
+        """
+        Demande l'actualisation des statistiques du tableau de bord.
+        
+        L'actualisation est différée de REFRESH_DEBOUNCE_MS afin que des
+        demandes rapprochées (suppressions successives) n'en fassent qu'une.
+        """
+        self._refresh_timer.start()
+    
+    def _do_refresh_stats(self):
         """Actualise les statistiques du tableau de bord."""
         try:
             # Récupérer les statistiques via les contrôleurs
             datasets = self.dataset_controller.list_datasets()
             total_datasets = len(datasets)
             
-            # Calculer les statistiques
-            total_images = 0
-            total_annotations = 0
-            
-            for dataset_info in datasets:
-                total_images += dataset_info.get('image_count', 0)
-                total_annotations += dataset_info.get('annotation_count', 0)
+            # Totaux à partir des compteurs déjà agrégés par la requête de liste
+            total_images = sum(d.get('image_count', 0) for d in datasets)
+            total_annotations = sum(d.get('annotation_count', 0) for d in datasets)
             
             # Mettre à jour l'affichage des statistiques
             if 'total_datasets' in self.stats_labels:
@@ -435,7 +511,7 @@ class DashboardView(BaseView):
         except Exception as e:
             self.logger.error(f"Erreur lors de l'actualisation des statistiques: {e}")
             # Valeurs par d�faut en cas d'erreur
-            for key in self.stats_labels:
+            for key in self._stat_label_keys:
                 self.stats_labels[key].setText("0")
     
     def _update_datasets_list(self, datasets):
@@ -445,11 +521,21 @@ class DashboardView(BaseView):
         
         # Vérifier si l'objet PyQt est valide
         try:
-            self.datasets_list.count()
+            self.datasets_list.model()
         except RuntimeError:
             return
             
-        self.datasets_list.clear()
+        # Ne rien reconstruire si les datasets n'ont pas changé
+        snapshot = tuple(
+            (d.get('name', 'Unknown'), d.get('image_count', 0), d.get('annotation_count', 0))
+            for d in datasets
+        )
+        if snapshot == self._datasets_snapshot:
+            return
+        self._datasets_snapshot = snapshot
+        
+        # Une seule réinitialisation du modèle; la vue ne formate que les lignes visibles
+        self._datasets_model.set_rows(snapshot)
         
         if not datasets:
             self.datasets_list.hide()
@@ -458,13 +544,3 @@ class DashboardView(BaseView):
         
         self.datasets_list.show()
         self.no_datasets_label.hide()
-        
-        # Ajouter tous les datasets
-        for dataset_info in datasets:
-            name = dataset_info.get('name', 'Unknown')
-            image_count = dataset_info.get('image_count', 0)
-            annotation_count = dataset_info.get('annotation_count', 0)
-            item_text = f"{name} - {image_count} images, {annotation_count} annotations"
-            
-            item = QListWidgetItem(item_text)
-            self.datasets_list.addItem(item)
\ No newline at end of file
@@ -4,8 +4,7 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QSplitter,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLabel,
     QPushButton,
     QFileDialog,
@@ -15,19 +14,404 @@ from PyQt6.QtWidgets import (
     QMenu
 )
 from typing import Any
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QPoint
-from PyQt6.QtGui import QPixmap, QIcon
+from PyQt6.QtCore import (
+    Qt, QSize, pyqtSignal, QPoint, QObject, QRunnable, QThreadPool, QTimer,
+    QAbstractListModel, QModelIndex
+)
+from PyQt6.QtGui import QPixmap, QIcon, QImage, QPixmapCache
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+import os
+from contextlib import contextmanager
+from functools import lru_cache
 
 from src.views.base_view import BaseView
 from src.models import Dataset, Image
 from src.controllers.controller_manager import ControllerManager
-from src.views.components.image_viewer import ImageViewer
+from src.views.components.image_viewer import ImageViewer, decode_image
 from src.views.components.annotation_editor import AnnotationEditor
 from src.views.dialogs.metadata_dialog import MetadataDetailsDialog
 from src.views.dialogs.export_dialog import ExportDialog
 from src.utils.i18n import get_translation_manager, tr
+from src.utils.thumbnail_cache import ThumbnailCache
+
+@lru_cache(maxsize=8192)
+def _locate_local_copy(url: str, dataset_name: str, dataset_path: str) -> Optional[Path]:
+    """
+    Cherche la copie locale d'une image référencée par une URL.
+    
+    Le résultat est mémorisé: les vérifications d'existence ne sont faites
+    qu'une fois par image et par dataset.
+    
+    Args:
+        url: Chemin de l'image (http:// ou https://)
+        dataset_name: Nom du dataset
+        dataset_path: Répertoire du dataset
+        
+    Returns:
+        Chemin local trouvé, ou None
+    """
+    # Extraire la partie locale du chemin
+    local_path = Path(url.split('://')[-1])
+    if local_path.exists():
+        return local_path
+    
+    # Essayer d'autres chemins possibles, construits un à un jusqu'au premier trouvé
+    filename = local_path.name
+    candidates = (
+        Path("data/datasets") / dataset_name / "images" / filename,
+        Path(dataset_path) / "images" / filename,
+        Path("data/downloads") / filename,
+        Path("downloads") / filename,
+    )
+    return next((p for p in candidates if p.exists()), None)
+
+
+class ThumbnailWorkerSignals(QObject):
+    """Signaux émis par les tâches de création de miniatures."""
+    
+    finished = pyqtSignal(int, str, str, QImage)  # génération, id d'image, chemin, miniature
+
+
+class ThumbnailWorker(QRunnable):
+    """Tâche de décodage d'une miniature hors du thread graphique."""
+    
+    def __init__(
+        self,
+        signals: ThumbnailWorkerSignals,
+        generation: int,
+        image_id: str,
+        path: str,
+        size: QSize,
+        cache: Optional[ThumbnailCache] = None
+    ):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.image_id = image_id
+        self.path = path
+        self.size = size
+        self.cache = cache
+        
+    def run(self):
+        """Lit la miniature du cache disque, ou décode l'image directement à sa taille"""
+        image = self.cache.get(self.path, self.size) if self.cache else None
+        if image is None:
+            image, _ = decode_image(self.path, self.size)
+            if self.cache and not image.isNull():
+                self.cache.put(self.path, self.size, image)
+        self.signals.finished.emit(self.generation, self.image_id, self.path, image)
+
+
+class ImportWorkerSignals(QObject):
+    """Signaux émis par les tâches d'import d'images."""
+    
+    scanned = pyqtSignal(int, object)  # génération, liste (index, chemin, os.stat_result ou None)
+    finished = pyqtSignal(int, int, object)  # génération, index du fichier, Image ou None
+
+
+class ImportScanWorker(QRunnable):
+    """Tâche de lecture des informations (os.stat) de tous les fichiers à importer, en une passe."""
+    
+    def __init__(self, signals: ImportWorkerSignals, generation: int, files: List[str]):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.files = files
+        
+    def run(self):
+        """Lit une seule fois les informations de chaque fichier"""
+        entries = []
+        for index, path in enumerate(self.files):
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                file_stat = None
+            entries.append((index, path, file_stat))
+        self.signals.scanned.emit(self.generation, entries)
+
+
+class ImportWorker(QRunnable):
+    """Tâche de lecture d'un fichier image à importer, hors du thread graphique."""
+    
+    def __init__(
+        self,
+        signals: ImportWorkerSignals,
+        generation: int,
+        index: int,
+        import_controller,
+        path: str,
+        file_stat: Optional[os.stat_result] = None
+    ):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.index = index
+        self.import_controller = import_controller
+        self.path = path
+        self.file_stat = file_stat
+        
+    def run(self):
+        """Crée l'image sans toucher au dataset, qui n'est modifié que sur le thread graphique"""
+        try:
+            image = self.import_controller.create_local_image(self.path, file_stat=self.file_stat)
+        except Exception:
+            image = None
+        self.signals.finished.emit(self.generation, self.index, image)
+
+
+class ImageListModel(QAbstractListModel):
+    """
+    Modèle de la liste des images du dataset.
+    
+    Chaque ligne est un tuple (image, nom affiché, chemin résolu). Les miniatures
+    ne sont demandées (signal thumbnail_requested) que lorsque la vue peint une
+    ligne sans icône, c'est-à-dire uniquement pour les lignes visibles.
+    
+    Les miniatures sont conservées dans le QPixmapCache du processus (éviction
+    LRU gérée par Qt), sous une clé réutilisable par les autres vues.
+    """
+    
+    thumbnail_requested = pyqtSignal(str)  # id de l'image dont la miniature manque
+    
+    # Clé des miniatures dans QPixmapCache
+    THUMBNAIL_CACHE_KEY = "thumb64:{}"
+    
+    def __init__(self, placeholder: QIcon, parent=None):
+        """
+        Initialise le modèle.
+        
+        Args:
+            placeholder: Icône affichée tant que la miniature n'est pas prête
+            parent: Objet parent
+        """
+        super().__init__(parent)
+        self._rows: List[Tuple[Image, str, str]] = []
+        self._row_by_id: Dict[Any, int] = {}  # id d'image -> ligne
+        self._placeholder = placeholder
+        self._requested = set()  # ids d'images dont la miniature est en cours de calcul
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Retourne le nombre d'images."""
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Retourne la donnée d'une ligne pour un rôle.
+        
+        Args:
+            index: Index de la ligne
+            role: Rôle demandé (nom, miniature, ou image pour UserRole)
+            
+        Returns:
+            Donnée demandée, ou None pour les autres rôles
+        """
+        if not index.isValid():
+            return None
+        
+        image, name, _ = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == Qt.ItemDataRole.DecorationRole:
+            pixmap = QPixmapCache.find(self.THUMBNAIL_CACHE_KEY.format(image.id))
+            if pixmap is not None:
+                return pixmap
+            # Miniature jamais calculée, ou évincée du cache: la redemander
+            if image.id not in self._requested:
+                self._requested.add(image.id)
+                self.thumbnail_requested.emit(image.id)
+            return self._placeholder
+        if role == Qt.ItemDataRole.UserRole:
+            return image
+        return None
+        
+    def set_rows(self, rows: List[Tuple[Image, str, str]]):
+        """
+        Remplace toutes les lignes en une seule réinitialisation du modèle.
+        
+        Les miniatures déjà calculées restent dans le cache (clé: id d'image).
+        
+        Args:
+            rows: Tuples (image, nom affiché, chemin résolu)
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._row_by_id = {row[0].id: i for i, row in enumerate(rows)}
+        self._requested.clear()
+        self.endResetModel()
+        
+    def image(self, row: int) -> Image:
+        """Retourne l'image d'une ligne."""
+        return self._rows[row][0]
+        
+    def path(self, row: int) -> str:
+        """Retourne le chemin résolu de l'image d'une ligne."""
+        return self._rows[row][2]
+        
+    def row_of(self, image_id: Any) -> Optional[int]:
+        """
+        Retourne la ligne d'une image.
+        
+        Args:
+            image_id: Identifiant de l'image
+            
+        Returns:
+            Ligne de l'image, ou None si elle n'est pas dans la liste
+        """
+        return self._row_by_id.get(image_id)
+        
+    def set_thumbnail(self, image_id: Any, pixmap: QPixmap):
+        """
+        Installe la miniature d'une image et notifie la vue.
+        
+        Args:
+            image_id: Identifiant de l'image
+            pixmap: Miniature
+        """
+        row = self._row_by_id.get(image_id)
+        if row is None:
+            return
+        
+        QPixmapCache.insert(self.THUMBNAIL_CACHE_KEY.format(image_id), pixmap)
+        self._requested.discard(image_id)
+        
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+        
+    def cancel_request(self, image_id: Any):
+        """
+        Annule la demande de miniature d'une image (sortie de la zone visible
+        avant d'avoir été traitée); elle sera redemandée au prochain affichage.
+        
+        Args:
+            image_id: Identifiant de l'image
+        """
+        self._requested.discard(image_id)
+        
+    def remove_row(self, row: int):
+        """
+        Retire une seule ligne, sans réinitialiser le modèle.
+        
+        Args:
+            row: Ligne à retirer
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        image = self._rows.pop(row)[0]
+        del self._row_by_id[image.id]
+        for i in range(row, len(self._rows)):
+            self._row_by_id[self._rows[i][0].id] = i
+        self.endRemoveRows()
+        self.forget(image.id)
+        
+    def forget(self, image_id: Any):
+        """
+        Oublie la miniature d'une image supprimée.
+        
+        Args:
+            image_id: Identifiant de l'image
+        """
+        QPixmapCache.remove(self.THUMBNAIL_CACHE_KEY.format(image_id))
+        self._requested.discard(image_id)
+
+
+class AnnotationListModel(QAbstractListModel):
+    """
+    Modèle de la liste des annotations de l'image courante.
+    
+    Le modèle référence directement la liste d'annotations de l'image; le texte
+    d'une ligne n'est formaté que lorsque la vue l'affiche.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialise le modèle.
+        
+        Args:
+            parent: Objet parent
+        """
+        super().__init__(parent)
+        self._annotations: list = []
+        self._classes: Dict[int, str] = {}
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Retourne le nombre d'annotations."""
+        return 0 if parent.isValid() else len(self._annotations)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Retourne la donnée d'une ligne pour un rôle.
+        
+        Args:
+            index: Index de la ligne
+            role: Rôle demandé (texte affiché, ou annotation pour UserRole)
+            
+        Returns:
+            Donnée demandée, ou None pour les autres rôles
+        """
+        if not index.isValid() or index.row() >= len(self._annotations):
+            return None
+        
+        annotation = self._annotations[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Texte de l'annotation en un seul formatage; le nom de repli n'est
+            # construit que pour une classe inconnue
+            class_name = self._classes.get(annotation.class_id)
+            if class_name is None:
+                class_name = f"Classe {annotation.class_id}"
+            
+            # La confiance vaut None par défaut sur Annotation
+            confidence = annotation.confidence
+            bbox = annotation.bbox
+            return (
+                f"{index.row()+1}: {class_name}"
+                f"{'' if confidence is None else f' {confidence:.2f}'}"
+                f" - ({bbox.x:.2f}, {bbox.y:.2f}, {bbox.width:.2f}, {bbox.height:.2f})"
+            )
+        if role == Qt.ItemDataRole.UserRole:
+            return annotation
+        return None
+        
+    def set_annotations(self, annotations: list, classes: Dict[int, str]):
+        """
+        Affiche une nouvelle liste d'annotations en une seule réinitialisation.
+        
+        Args:
+            annotations: Annotations de l'image (référencées, non copiées)
+            classes: Noms des classes du dataset
+        """
+        self.beginResetModel()
+        self._annotations = annotations
+        self._classes = classes
+        self.endResetModel()
+        
+    def refresh_row(self, row: int):
+        """
+        Signale la modification d'une seule annotation.
+        
+        Args:
+            row: Ligne de l'annotation modifiée
+        """
+        if 0 <= row < len(self._annotations):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+            
+    def remove_row(self, row: int):
+        """
+        Supprime une annotation de l'image et retire sa ligne sans réinitialiser le modèle.
+        
+        Args:
+            row: Ligne de l'annotation à supprimer
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._annotations[row]
+        self.endRemoveRows()
+        
+        # Les lignes suivantes sont renumérotées
+        if row < len(self._annotations):
+            self.dataChanged.emit(
+                self.index(row), self.index(len(self._annotations) - 1), [Qt.ItemDataRole.DisplayRole]
+            )
+
 
 class DatasetView(BaseView):
     """
@@ -45,6 +429,29 @@ class DatasetView(BaseView):
     image_selected = pyqtSignal(Image)  # Émis quand une image est sélectionnée
     annotation_selected = pyqtSignal(int)  # Émis quand une annotation est sélectionnée
     
+    # Taille des miniatures de la liste des images
+    THUMBNAIL_SIZE = QSize(64, 64)
+    
+    # Délai avant de décoder les miniatures visibles après un défilement (ms)
+    THUMBNAIL_DEBOUNCE_MS = 50
+    
+    # Nombre maximal de fichiers lus en parallèle lors d'un import
+    MAX_IMPORT_THREADS = 8
+    
+    # Délai avant de charger l'image sélectionnée, pour absorber la navigation au clavier (ms)
+    SELECTION_DEBOUNCE_MS = 120
+    
+    # Gabarit de l'en-tête du panneau de métadonnées
+    METADATA_HEADER = (
+        "<b>Fichier:</b> {filename}<br>"
+        "<b>Dimensions:</b> {width} × {height}<br>"
+        "<b>Source:</b> {source}<br>"
+        "<b>Créé le:</b> {created_at}"
+    )
+    
+    # Métadonnées affichées en priorité, dans cet ordre
+    METADATA_IMPORTANT_KEYS = ('coordinates', 'camera_make', 'camera_model', 'captured_at', 'compass_angle')
+    
     def __init__(
         self, 
         parent=None, 
@@ -63,6 +470,54 @@ class DatasetView(BaseView):
         self.dataset: Optional[Dataset] = None
         self.current_image: Optional[Image] = None
         
+        # Miniatures décodées en arrière-plan
+        self._thumbnail_generation = 0  # Incrémenté à chaque reconstruction de la liste
+        self._thumbnail_signals = ThumbnailWorkerSignals(self)
+        self._thumbnail_signals.finished.connect(self._on_thumbnail_ready)
+        self._thumbnail_cache = ThumbnailCache(logger=self.logger)
+        placeholder = QPixmap(self.THUMBNAIL_SIZE)
+        placeholder.fill(Qt.GlobalColor.transparent)
+        self._image_model = ImageListModel(QIcon(placeholder), self)
+        self._image_model.thumbnail_requested.connect(self._on_thumbnail_requested)
+        
+        # Lignes en attente de miniature, traitées une fois le défilement stabilisé
+        self._pending_thumbnails = set()
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(self.THUMBNAIL_DEBOUNCE_MS)
+        self._thumbnail_timer.timeout.connect(self._dispatch_thumbnails)
+        
+        # Annotations de l'image courante
+        self._annotation_model = AnnotationListModel(self)
+        
+        # Import d'images en arrière-plan, sur un pool dédié pour ne pas retarder les miniatures
+        self._import_pool = QThreadPool(self)
+        self._import_pool.setMaxThreadCount(min(self.MAX_IMPORT_THREADS, os.cpu_count() or 1))
+        self._import_signals = ImportWorkerSignals(self)
+        self._import_signals.scanned.connect(self._on_import_scanned)
+        self._import_signals.finished.connect(self._on_image_imported)
+        self._import_generation = 0
+        self._import_results: List[Optional[Image]] = []
+        self._import_remaining = 0
+        
+        # Modifications groupées: notifications différées jusqu'à la fin du lot
+        self._bulk_depth = 0
+        self._bulk_dirty = False
+        self._bulk_modified = False
+        
+        # Statistiques du dataset, invalidées à chaque modification
+        self._stats_cache: Optional[Dict] = None
+        self._load_stats_templates()
+        
+        # HTML des métadonnées par id d'image: ((chemin, date de modification), html)
+        self._metadata_html_cache: Dict[Any, Tuple[Tuple[str, Any], str]] = {}
+        
+        # Chargement différé de l'image sélectionnée
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(self.SELECTION_DEBOUNCE_MS)
+        self._selection_timer.timeout.connect(self._apply_selection)
+        
         # Initialiser l'interface
         self._init_ui()
         
@@ -140,13 +595,21 @@ class DatasetView(BaseView):
         panel_layout = QVBoxLayout(panel)
         
         # Liste des images
-        self.image_list = QListWidget()
-        self.image_list.setIconSize(QSize(64, 64))
-        self.image_list.itemSelectionChanged.connect(self._on_image_selected)
+        self.image_list = QListView()
+        self.image_list.setModel(self._image_model)
+        self.image_list.setIconSize(self.THUMBNAIL_SIZE)
+        self.image_list.setUniformItemSizes(True)
+        self.image_list.selectionModel().currentChanged.connect(self._on_image_selected)
+        self.image_list.verticalScrollBar().valueChanged.connect(self._on_image_list_scrolled)
         self.image_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.image_list.customContextMenuRequested.connect(self._on_image_context_menu)
         panel_layout.addWidget(self.image_list)
         
+        # Menu contextuel construit une seule fois et réutilisé à chaque clic droit
+        self._image_menu = QMenu(self.image_list)
+        self._image_menu_edit = self._image_menu.addAction(tr("view.dataset.edit_annotations"))
+        self._image_menu_delete = self._image_menu.addAction(tr("view.dataset.delete_image"))
+        
         # Statistiques des images
         stats_group = QGroupBox(tr("view.dataset.statistics"))
         stats_layout = QVBoxLayout(stats_group)
@@ -232,12 +695,19 @@ class DatasetView(BaseView):
         annotations_group = QGroupBox(tr("view.dataset.annotations"))
         annotations_layout = QVBoxLayout(annotations_group)
         
-        self.annotation_list = QListWidget()
-        self.annotation_list.itemSelectionChanged.connect(self._on_annotation_list_selected)
+        self.annotation_list = QListView()
+        self.annotation_list.setModel(self._annotation_model)
+        self.annotation_list.setUniformItemSizes(True)
+        self.annotation_list.selectionModel().currentChanged.connect(self._on_annotation_list_selected)
         self.annotation_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.annotation_list.customContextMenuRequested.connect(self._on_annotation_context_menu)
         annotations_layout.addWidget(self.annotation_list)
         
+        # Menu contextuel construit une seule fois et réutilisé à chaque clic droit
+        self._annotation_menu = QMenu(self.annotation_list)
+        self._annotation_menu_edit = self._annotation_menu.addAction(tr("view.dataset.edit_mode"))
+        self._annotation_menu_delete = self._annotation_menu.addAction(tr("view.dataset.delete_annotation"))
+        
         # Boutons d'édition des annotations
         annotation_buttons = QHBoxLayout()
         
@@ -271,7 +741,11 @@ class DatasetView(BaseView):
         Args:
             dataset: Dataset à afficher
         """
+        self._cancel_import()
         self.dataset = dataset
+        self._stats_cache = None
+        self._invalidate_image_paths()  # Des fichiers ont pu être téléchargés depuis
+        self._metadata_html_cache.clear()
         self._update_ui()
         self.dataset_loaded.emit(dataset)
         
@@ -290,146 +764,228 @@ class DatasetView(BaseView):
             self.logger.debug("Aucun dataset chargé, pas de mise à jour de l'UI")
             return
             
-        # Vider et recharger la liste des images
-        self.image_list.clear()
+        # Les miniatures encore en cours de décodage pour l'ancienne liste seront ignorées
+        self._thumbnail_generation += 1
+        self._pending_thumbnails.clear()
         self.logger.debug(f"Mise à jour de l'UI avec {len(self.dataset.images)} images")
         
+        # Évaluer le niveau une fois: les messages par image ne sont construits qu'en débogage
+        debug_enabled = self.logger.is_debug_enabled()
+        
+        # Seuls le nom et le chemin sont préparés ici; les miniatures sont
+        # décodées à la demande pour les lignes affichées
+        rows = []
         for i, image in enumerate(self.dataset.images):
             try:
-                self.logger.debug(f"Ajout de l'image {i}: {image.path}")
-                item = QListWidgetItem()
-                
-                # Gérer correctement le chemin et le nom de fichier
-                if isinstance(image.path, Path):
-                    file_name = image.path.name
-                    path_str = str(image.path)
-                else:
-                    # Si c'est une chaîne, la traiter correctement
-                    path_str = str(image.path)
-                    
-                    # Corriger les chemins problématiques
-                    if path_str.startswith(('http://', 'https://')):
-                        # Extraire la partie locale du chemin
-                        local_part = path_str.split('://')[-1]
-                        
-                        # Vérifier si le chemin local existe
-                        local_path = Path(local_part)
-                        if local_path.exists():
-                            path_str = str(local_path)
-                            file_name = local_path.name
-                        else:
-                            # Essayer d'autres chemins possibles
-                            filename = local_path.name
-                            
-                            potential_paths = [
-                                Path("data/datasets") / self.dataset.name / "images" / filename,
-                                Path(self.dataset.path) / "images" / filename,
-                                Path("data/downloads") / filename,
-                                Path("downloads") / filename
-                            ]
-                            
-                            for potential_path in potential_paths:
-                                if potential_path.exists():
-                                    path_str = str(potential_path)
-                                    file_name = filename
-                                    break
-                            else:
-                                # Si aucun chemin local n'est trouvé, utiliser le nom de fichier seul
-                                file_name = filename
-                    else:
-                        # Chemin normal, extraire le nom
-                        try:
-                            file_name = Path(path_str).name
-                        except:
-                            file_name = path_str.split("/")[-1]
+                if debug_enabled:
+                    self.logger.debug(f"Ajout de l'image {i}: {image.path}")
                 
-                item.setText(file_name)
-                item.setData(Qt.ItemDataRole.UserRole, image)
-                
-                # Essayer de charger la miniature
-                try:
-                    # Vérifier si le fichier existe localement
-                    if Path(path_str).exists():
-                        pixmap = QPixmap(path_str)
-                        if not pixmap.isNull():
-                            scaled_pixmap = pixmap.scaled(
-                                64, 64,
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation
-                            )
-                            item.setIcon(QIcon(scaled_pixmap))
-                        else:
-                            self.logger.warning(f"Échec du chargement du pixmap pour {path_str}")
-                    else:
-                        self.logger.warning(f"Fichier non trouvé pour la miniature: {path_str}")
-                except Exception as e:
-                    self.logger.warning(f"Échec de la création de miniature pour {path_str}: {e}")
-                
-                self.image_list.addItem(item)
+                path_str, file_name = self._resolve_image_path(image)
+                rows.append((image, file_name, path_str))
             except Exception as e:
                 self.logger.error(f"Erreur lors de l'ajout de l'image {getattr(image, 'path', 'N/A')} à la liste: {e}")
         
+        # Une seule réinitialisation du modèle pour toute la liste
+        self._image_model.set_rows(rows)
+        
         # Mettre à jour les statistiques
+        self._update_stats()
+        
+        self.logger.debug("Mise à jour de l'UI terminée")
+
+    def _update_stats(self):
+        """Met à jour les statistiques du dataset, calculées une fois par modification."""
+        if not self.dataset:
+            return
+        
         try:
-            stats = self.dataset_controller.get_dataset_statistics(self.dataset)
-            if stats:
-                self.total_images_label.setText(tr("view.dataset.total_images", stats["total_images"]))
-                self.total_annotations_label.setText(tr("view.dataset.total_annotations", stats["total_annotations"]))
-                self.classes_label.setText(f"Classes: {len(self.dataset.classes)}")
+            if self._stats_cache is None:
+                self._stats_cache = self.dataset_controller.get_dataset_statistics(self.dataset)
+            self._show_stats(self._stats_cache)
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour des statistiques: {e}")
             # Utiliser des statistiques basiques
             self.total_images_label.setText(f"Total Images: {len(self.dataset.images)}")
             self.total_annotations_label.setText("Total Annotations: N/A")
             self.classes_label.setText(f"Classes: {len(self.dataset.classes)}")
+            
+    def _adjust_stats(self, images: int = 0, annotations: int = 0):
+        """
+        Corrige les compteurs en place après un ajout ou une suppression, sans recalcul.
         
-        self.logger.debug("Mise à jour de l'UI terminée")
+        Args:
+            images: Variation du nombre d'images
+            annotations: Variation du nombre d'annotations
+        """
+        if not self._stats_cache:
+            self._update_stats()
+            return
+        
+        stats = dict(self._stats_cache)
+        stats["total_images"] = stats.get("total_images", 0) + images
+        stats["total_annotations"] = stats.get("total_annotations", 0) + annotations
+        self._stats_cache = stats
+        self._show_stats(stats)
+        
+    def _load_stats_templates(self):
+        """Charge les gabarits traduits des statistiques (à recharger au changement de langue)."""
+        self._tpl_total_images = tr("view.dataset.total_images")
+        self._tpl_total_annotations = tr("view.dataset.total_annotations")
+        self._tpl_classes = tr("view.dataset.classes")
+        
+    def _show_stats(self, stats: Optional[Dict]):
+        """
+        Affiche des statistiques dans le panneau.
+        
+        Args:
+            stats: Statistiques du dataset
+        """
+        if stats:
+            self.total_images_label.setText(self._tpl_total_images.format(stats["total_images"]))
+            self.total_annotations_label.setText(self._tpl_total_annotations.format(stats["total_annotations"]))
+            self.classes_label.setText(self._tpl_classes.format(len(self.dataset.classes)))
 
-    def _on_image_selected(self):
-        """Gère la sélection d'une image dans la liste."""
-        items = self.image_list.selectedItems()
-        if not items:
+    def _on_thumbnail_requested(self, image_id: str):
+        """
+        Enregistre une image affichée sans miniature.
+        
+        Args:
+            image_id: Identifiant de l'image
+        """
+        self._pending_thumbnails.add(image_id)
+        if not self._thumbnail_timer.isActive():
+            self._thumbnail_timer.start()
+            
+    def _on_image_list_scrolled(self, value: int):
+        """Repousse le décodage des miniatures tant que la liste défile."""
+        if self._pending_thumbnails:
+            self._thumbnail_timer.start()
+            
+    def _dispatch_thumbnails(self):
+        """Lance le décodage des miniatures en attente encore visibles."""
+        viewport = self.image_list.viewport().rect()
+        first = self.image_list.indexAt(viewport.topLeft())
+        last = self.image_list.indexAt(viewport.bottomLeft())
+        first_row = first.row() if first.isValid() else 0
+        last_row = last.row() if last.isValid() else self._image_model.rowCount() - 1
+        
+        thread_pool = QThreadPool.globalInstance()
+        for image_id in self._pending_thumbnails:
+            row = self._image_model.row_of(image_id)
+            if row is None:
+                continue
+            if first_row <= row <= last_row:
+                thread_pool.start(ThumbnailWorker(
+                    self._thumbnail_signals, self._thumbnail_generation, image_id,
+                    self._image_model.path(row), self.THUMBNAIL_SIZE, self._thumbnail_cache
+                ))
+            else:
+                # Ligne dépassée pendant le défilement: elle sera redemandée si elle réapparaît
+                self._image_model.cancel_request(image_id)
+        self._pending_thumbnails.clear()
+
+    def _on_thumbnail_ready(self, generation: int, image_id: str, path: str, image: QImage):
+        """
+        Installe une miniature décodée en arrière-plan.
+        
+        Args:
+            generation: Génération de la liste ayant lancé la tâche
+            image_id: Identifiant de l'image
+            path: Chemin de l'image
+            image: Miniature décodée (nulle en cas d'échec)
+        """
+        # Ignorer les miniatures d'une liste reconstruite depuis
+        if generation != self._thumbnail_generation:
+            return
+        
+        if image.isNull():
+            if not Path(path).exists():
+                self.logger.warning(f"Fichier non trouvé pour la miniature: {path}")
+            else:
+                self.logger.warning(f"Échec du chargement du pixmap pour {path}")
+            return
+        
+        self._image_model.set_thumbnail(image_id, QPixmap.fromImage(image))
+
+    def _invalidate_image_paths(self):
+        """
+        Oublie les chemins d'images résolus, par cette vue comme par le visualiseur.
+        
+        Les deux résolutions sont mémorisées avec des dossiers candidats
+        différents: elles sont toujours invalidées ensemble.
+        """
+        _locate_local_copy.cache_clear()
+        ImageViewer.forget_resolved_paths()
+        
+    def _resolve_image_path(self, image: Image) -> Tuple[str, str]:
+        """
+        Résout le chemin local d'une image et son nom de fichier.
+        
+        Les chemins distants (http://, https://) dont une copie locale existe
+        sont remplacés sur l'image par ce chemin local, de sorte que les appels
+        suivants prennent directement le chemin rapide.
+        
+        Args:
+            image: Image à résoudre
+            
+        Returns:
+            Tuple (chemin à utiliser, nom de fichier)
+        """
+        if isinstance(image.path, Path):
+            return str(image.path), image.path.name
+        
+        path_str = str(image.path)
+        if not path_str.startswith(('http://', 'https://')):
+            # Chemin normal, extraire le nom
+            try:
+                return path_str, Path(path_str).name
+            except:
+                return path_str, path_str.split("/")[-1]
+        
+        found = _locate_local_copy(path_str, self.dataset.name, str(self.dataset.path))
+        if found is None:
+            return path_str, Path(path_str.split('://')[-1]).name
+        
+        image.path = found
+        if self.logger.is_debug_enabled():
+            self.logger.debug(f"Chemin corrigé: {path_str} -> {found}")
+        return str(found), found.name
+
+    def _on_image_selected(self, current: QModelIndex, previous: QModelIndex):
+        """
+        Gère le changement d'image courante dans la liste.
+        
+        Le chargement est différé: une rafale de changements (flèches
+        maintenues) ne charge que l'image finalement retenue.
+        
+        Args:
+            current: Nouvel index courant
+            previous: Index courant précédent
+        """
+        if current.isValid():
+            self._selection_timer.start()
+        
+    def _apply_selection(self):
+        """Charge l'image courante une fois la navigation stabilisée."""
+        current = self.image_list.currentIndex()
+        if not current.isValid():
             return
             
         try:
-            # Récupérer l'image sélectionnée
-            image = items[0].data(Qt.ItemDataRole.UserRole)
+            # Récupérer l'image courante
+            row = current.row()
+            image = self._image_model.image(row)
             
-            if image != self.current_image:
+            # Comparer par identité: l'égalité pydantic comparerait tous les champs et annotations
+            if image is not self.current_image:
                 self.current_image = image
                 
                 # Debug logging pour faciliter la résolution de problèmes
-                self.logger.debug(f"Image sélectionnée: {image.id}, path type: {type(image.path)}, path: {image.path}")
+                if self.logger.is_debug_enabled():
+                    self.logger.debug(f"Image sélectionnée: {image.id}, path type: {type(image.path)}, path: {image.path}")
                 
                 # S'assurer que le chemin est correct avant de charger l'image
-                path_str = str(image.path)
-                
-                # Correction des chemins problématiques
-                if path_str.startswith(('http://', 'https://')):
-                    # Extraire la partie locale du chemin
-                    local_part = path_str.split('://')[-1]
-                    local_path = Path(local_part)
-                    
-                    # Vérifier si le chemin local existe
-                    if local_path.exists():
-                        image.path = local_path
-                        self.logger.debug(f"Chemin corrigé: {path_str} -> {local_path}")
-                    else:
-                        # Essayer d'autres chemins possibles
-                        filename = local_path.name
-                        
-                        potential_paths = [
-                            Path("data/datasets") / self.dataset.name / "images" / filename,
-                            Path(self.dataset.path) / "images" / filename,
-                            Path("data/downloads") / filename,
-                            Path("downloads") / filename
-                        ]
-                        
-                        for potential_path in potential_paths:
-                            if potential_path.exists():
-                                image.path = potential_path
-                                self.logger.debug(f"Chemin alternatif trouvé: {path_str} -> {potential_path}")
-                                break
+                self._resolve_image_path(image)
                 
                 # Charger l'image dans le viewer
                 try:
@@ -439,6 +995,10 @@ class DatasetView(BaseView):
                             "Erreur",
                             f"Échec du chargement de l'image: {image.path}"
                         )
+                    
+                    # Décoder à l'avance l'image suivante de la liste
+                    if row + 1 < self._image_model.rowCount():
+                        self.image_viewer.prefetch_image(self._image_model.image(row + 1))
                 except Exception as e:
                     self.logger.error(f"Erreur lors du chargement de l'image dans le viewer: {str(e)}")
                     self.show_error(
@@ -468,121 +1028,133 @@ class DatasetView(BaseView):
         Args:
             index: Index de l'annotation sélectionnée
         """
-        if 0 <= index < self.annotation_list.count():
-            self.annotation_list.setCurrentRow(index)
+        if 0 <= index < self._annotation_model.rowCount():
+            self.annotation_list.setCurrentIndex(self._annotation_model.index(index))
             self.annotation_selected.emit(index)
             
-    def _on_annotation_list_selected(self):
-        """Gère la sélection d'une annotation dans la liste."""
-        items = self.annotation_list.selectedItems()
-        if items:
-            index = self.annotation_list.row(items[0])
+    def _on_annotation_list_selected(self, current: QModelIndex, previous: QModelIndex):
+        """
+        Gère le changement d'annotation courante dans la liste.
+        
+        Args:
+            current: Nouvel index courant
+            previous: Index courant précédent
+        """
+        if current.isValid():
+            index = current.row()
             self.image_viewer.select_annotation(index)
             self.annotation_selected.emit(index)
             
     def _update_metadata(self):
         """Met à jour l'affichage des métadonnées."""
-        if not self.current_image:
+        image = self.current_image
+        if not image:
             self.image_info_label.setText("")
             return
+        
+        # Réutiliser le HTML tant que l'image n'a été ni modifiée ni déplacée
+        signature = (str(image.path), image.modified_at)
+        cached = self._metadata_html_cache.get(image.id)
+        if cached is None or cached[0] != signature:
+            cached = (signature, self._build_metadata_html(image))
+            self._metadata_html_cache[image.id] = cached
+        
+        self.image_info_label.setText(cached[1])
+        
+    def _build_metadata_html(self, image: Image) -> str:
+        """
+        Construit le HTML des métadonnées d'une image.
+        
+        Args:
+            image: Image à décrire
             
+        Returns:
+            HTML des métadonnées
+        """
         # Obtenir le nom de fichier de manière sécurisée
         try:
-            if isinstance(self.current_image.path, Path):
-                filename = self.current_image.path.name
-            else:
-                path_str = str(self.current_image.path)
-                if path_str.startswith(('http://', 'https://')):
-                    # Extraire le nom de fichier de l'URL
-                    filename = Path(path_str.split('://')[-1]).name
-                else:
-                    filename = Path(path_str).name
+            _, filename = self._resolve_image_path(image)
         except:
-            filename = str(self.current_image.path)
+            filename = str(image.path)
         
-        # Formater les métadonnées en HTML pour une meilleure présentation
-        metadata_html = f"""
-        <b>Fichier:</b> {filename}<br>
-        <b>Dimensions:</b> {self.current_image.width} × {self.current_image.height}<br>
-        <b>Source:</b> {self.current_image.source.value}<br>
-        <b>Créé le:</b> {self.current_image.created_at.strftime('%Y-%m-%d %H:%M:%S')}
-        """
+        # Formater les métadonnées en HTML pour une meilleure présentation;
+        # les fragments sont accumulés puis assemblés en une seule fois
+        parts = [self.METADATA_HEADER.format(
+            filename=filename,
+            width=image.width,
+            height=image.height,
+            source=image.source.value,
+            created_at=image.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        )]
         
-        if self.current_image.modified_at:
-            metadata_html += f"<br><b>Modifié le:</b> {self.current_image.modified_at.strftime('%Y-%m-%d %H:%M:%S')}"
+        if image.modified_at:
+            parts.append(f"<br><b>Modifié le:</b> {image.modified_at.strftime('%Y-%m-%d %H:%M:%S')}")
             
         # Ajouter d'autres métadonnées si disponibles, mais de façon limitée
-        if self.current_image.metadata:
-            metadata_html += "<br><br><b>Métadonnées:</b><br>"
+        if image.metadata:
+            parts.append("<br><br><b>Métadonnées:</b><br>")
             
             # Limiter le nombre de métadonnées affichées
-            important_keys = ['coordinates', 'camera_make', 'camera_model', 'captured_at', 'compass_angle']
+            important_keys = self.METADATA_IMPORTANT_KEYS
             count = 0
             
             # D'abord afficher les clés importantes
             for key in important_keys:
-                if key in self.current_image.metadata:
-                    value = self.current_image.metadata[key]
+                if key in image.metadata:
+                    value = image.metadata[key]
                     # Si c'est un dictionnaire, afficher de manière concise
                     if isinstance(value, dict):
                         # Pour les coordonnées, formater de manière spéciale
                         if key == 'coordinates':
-                            lat = value.get('latitude', 'N/A')
-                            lon = value.get('longitude', 'N/A')
-                            if isinstance(lat, (float, int)) and isinstance(lon, (float, int)):
-                                metadata_html += f"<b>Position:</b> {lat:.5f}, {lon:.5f}<br>"
-                            else:
-                                metadata_html += f"<b>Position:</b> {lat}, {lon}<br>"
+                            parts.append(f"<b>Position:</b> {self._format_coordinates(value)}<br>")
                         else:
                             # Limiter à 2-3 sous-clés importantes
                             value_str = ", ".join([f"{k}: {v}" for k, v in list(value.items())[:2]])
-                            metadata_html += f"<b>{key}:</b> {value_str}<br>"
+                            parts.append(f"<b>{key}:</b> {value_str}<br>")
                     else:
-                        metadata_html += f"<b>{key}:</b> {value}<br>"
+                        parts.append(f"<b>{key}:</b> {value}<br>")
                     count += 1
             
             # Ensuite, ajouter quelques autres métadonnées si nécessaire
-            for key, value in self.current_image.metadata.items():
-                if key not in important_keys and count < 5:  # Limiter à 5 métadonnées au total
+            for key, value in image.metadata.items():
+                if count >= 5:  # Limiter à 5 métadonnées au total
+                    break
+                if key not in important_keys:
                     if not isinstance(value, (dict, list)) or len(str(value)) < 50:
-                        metadata_html += f"<b>{key}:</b> {value}<br>"
+                        parts.append(f"<b>{key}:</b> {value}<br>")
                         count += 1
             
             # Indiquer s'il y a plus de métadonnées non affichées
-            remaining = len(self.current_image.metadata) - count
+            remaining = len(image.metadata) - count
             if remaining > 0:
-                metadata_html += f"<i>Et {remaining} autres métadonnées...</i>"
+                parts.append(f"<i>Et {remaining} autres métadonnées...</i>")
         
-        self.image_info_label.setText(metadata_html)
+        return "".join(parts)
+    
+    @staticmethod
+    def _format_coordinates(coordinates: Dict) -> str:
+        """
+        Formate une position géographique.
+        
+        Args:
+            coordinates: Dictionnaire avec les clés 'latitude' et 'longitude'
+            
+        Returns:
+            Position sous la forme "lat, lon" (5 décimales si numériques)
+        """
+        lat = coordinates.get('latitude', 'N/A')
+        lon = coordinates.get('longitude', 'N/A')
+        if isinstance(lat, (float, int)) and isinstance(lon, (float, int)):
+            return f"{lat:.5f}, {lon:.5f}"
+        return f"{lat}, {lon}"
             
     def _update_annotations(self):
         """Met à jour la liste des annotations."""
-        self.annotation_list.clear()
-        
         if not self.current_image:
+            self._annotation_model.set_annotations([], {})
             return
-            
-        for i, annotation in enumerate(self.current_image.annotations):
-            item = QListWidgetItem()
-            
-            # Texte de l'annotation avec plus d'informations
-            class_id = annotation.class_id
-            class_name = self.dataset.classes.get(class_id, f"Classe {class_id}")
-            
-            # Format plus lisible
-            bbox = annotation.bbox
-            bbox_text = f"({bbox.x:.2f}, {bbox.y:.2f}, {bbox.width:.2f}, {bbox.height:.2f})"
-            
-            confidence_text = ""
-            if hasattr(annotation, 'confidence') and annotation.confidence is not None:
-                confidence_text = f" {annotation.confidence:.2f}"
-                
-            text = f"{i+1}: {class_name}{confidence_text} - {bbox_text}"
-                
-            item.setText(text)
-            item.setData(Qt.ItemDataRole.UserRole, annotation)
-            
-            self.annotation_list.addItem(item)
+        
+        self._annotation_model.set_annotations(self.current_image.annotations, self.dataset.classes)
             
     def _on_image_loaded(self, success: bool):
         """
@@ -604,20 +1176,15 @@ class DatasetView(BaseView):
         Args:
             position: Position du clic
         """
-        if not self.image_list.selectedItems():
+        if not self.image_list.selectionModel().hasSelection():
             return
             
-        # Créer le menu
-        menu = QMenu()
-        edit_action = menu.addAction(tr("view.dataset.edit_annotations"))
-        delete_action = menu.addAction(tr("view.dataset.delete_image"))
-        
         # Exécuter le menu
-        action = menu.exec(self.image_list.mapToGlobal(position))
+        action = self._image_menu.exec(self.image_list.mapToGlobal(position))
         
-        if action == edit_action:
+        if action == self._image_menu_edit:
             self._on_edit_annotation()
-        elif action == delete_action:
+        elif action == self._image_menu_delete:
             self._on_delete_image()
             
     def _on_annotation_context_menu(self, position):
@@ -627,20 +1194,15 @@ class DatasetView(BaseView):
         Args:
             position: Position du clic
         """
-        if not self.annotation_list.selectedItems():
+        if not self.annotation_list.selectionModel().hasSelection():
             return
             
-        # Créer le menu
-        menu = QMenu()
-        edit_action = menu.addAction(tr("view.dataset.edit_mode"))
-        delete_action = menu.addAction(tr("view.dataset.delete_annotation"))
-        
         # Exécuter le menu
-        action = menu.exec(self.annotation_list.mapToGlobal(position))
+        action = self._annotation_menu.exec(self.annotation_list.mapToGlobal(position))
         
-        if action == edit_action:
+        if action == self._annotation_menu_edit:
             self._on_edit_annotation()
-        elif action == delete_action:
+        elif action == self._annotation_menu_delete:
             self._on_delete_annotation()
             
     def _on_add_images(self):
@@ -657,61 +1219,158 @@ class DatasetView(BaseView):
         )
         
         if files:
+            # Lire les fichiers en parallèle; les résultats sont ajoutés au
+            # dataset sur le thread graphique, dans l'ordre de sélection
+            self._import_generation += 1
+            self._import_results = [None] * len(files)
+            self._import_remaining = len(files)
+            self.add_images_btn.setEnabled(False)
             self.show_progress(True, len(files))
             
-            try:
-                # Utiliser le contrôleur d'import
-                imported_count = 0
-                failed_count = 0
+            self._import_pool.start(ImportScanWorker(self._import_signals, self._import_generation, files))
+            
+    def _on_import_scanned(self, generation: int, entries: list):
+        """
+        Lance la lecture des fichiers à importer, les plus petits d'abord.
+        
+        Args:
+            generation: Import ayant lancé la tâche
+            entries: Tuples (index, chemin, os.stat_result ou None)
+        """
+        if generation != self._import_generation:
+            return
+        
+        # Les petits fichiers se terminent vite: la progression démarre tout de suite
+        entries.sort(key=lambda entry: entry[2].st_size if entry[2] is not None else 0)
+        for index, file_path, file_stat in entries:
+            self._import_pool.start(ImportWorker(
+                self._import_signals, generation, index, self.import_controller, file_path, file_stat
+            ))
                 
-                for i, file_path in enumerate(files, 1):
-                    try:
-                        # Importer l'image
-                        success = self.import_controller.import_image_to_dataset(
-                            dataset=self.dataset,
-                            image_path=file_path
-                        )
-                        
-                        if success:
-                            imported_count += 1
-                        else:
-                            failed_count += 1
-                        
-                        # Mettre à jour la progression
-                        self.set_progress(i)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Échec de l'import du fichier {file_path}: {str(e)}")
-                        failed_count += 1
+    def _on_image_imported(self, generation: int, index: int, image: Optional[Image]):
+        """
+        Enregistre le résultat de la lecture d'un fichier à importer.
+        
+        Args:
+            generation: Import ayant lancé la tâche
+            index: Index du fichier dans la sélection
+            image: Image créée, ou None en cas d'échec
+        """
+        if generation != self._import_generation:
+            return
+        
+        self._import_results[index] = image
+        self._import_remaining -= 1
+        self.set_progress(len(self._import_results) - self._import_remaining)
+        
+        if self._import_remaining == 0:
+            self._finish_import()
+            
+    def _finish_import(self):
+        """Ajoute les images lues au dataset et met à jour l'interface une seule fois."""
+        try:
+            images = [image for image in self._import_results if image is not None]
+            failed_count = len(self._import_results) - len(images)
+            
+            # Une seule notification pour l'ensemble des images importées
+            with self._bulk_edit():
+                imported_count = self.import_controller.add_images_to_dataset(self.dataset, images)
+                self._invalidate_image_paths()
+                failed_count += len(images) - imported_count
                 
-                # Mettre à jour l'interface
+                # Mettre à jour l'interface; les statistiques sont recalculées
+                self._stats_cache = None
                 self._update_ui()
                 
                 # Marquer le dataset comme modifié
-                self.mark_as_dirty()
-                
-                # Afficher un résumé
-                self.show_info(
-                    "Import terminé",
-                    f"Importé {imported_count} images avec succès, {failed_count} échecs"
-                )
-                
-            except Exception as e:
-                self.logger.error(f"Erreur lors de l'import des images: {str(e)}")
-                self.show_error(
-                    "Erreur",
-                    f"Échec de l'import des images: {str(e)}"
-                )
-            finally:
-                self.show_progress(False)
+                if imported_count:
+                    self.mark_as_dirty()
+                    self._notify_dataset_modified()
+            
+            # Afficher un résumé
+            self.show_info(
+                "Import terminé",
+                f"Importé {imported_count} images avec succès, {failed_count} échecs"
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'import des images: {str(e)}")
+            self.show_error(
+                "Erreur",
+                f"Échec de l'import des images: {str(e)}"
+            )
+        finally:
+            self._import_results = []
+            self.add_images_btn.setEnabled(True)
+            self.show_progress(False)
                 
+    def mark_as_dirty(self, is_dirty: bool = True, invalidate_stats: bool = True):
+        """
+        Marque la vue comme modifiée et invalide les statistiques en cache.
+        
+        Pendant un lot de modifications (_bulk_edit), le marquage est
+        différé à la fin du lot.
+        
+        Args:
+            is_dirty: True si la vue a des modifications non sauvegardées
+            invalidate_stats: False si l'appelant a déjà ajusté les
+                statistiques en cache (_adjust_stats)
+        """
+        if is_dirty and invalidate_stats:
+            self._stats_cache = None
+        if is_dirty and self._bulk_depth:
+            self._bulk_dirty = True
+            return
+        super().mark_as_dirty(is_dirty)
+        
+    def _notify_dataset_modified(self):
+        """Émet dataset_modified, une seule fois par lot de modifications."""
+        if self._bulk_depth:
+            self._bulk_modified = True
+            return
+        self.dataset_modified.emit(self.dataset)
+        
+    @contextmanager
+    def _bulk_edit(self):
+        """
+        Regroupe plusieurs modifications du dataset.
+        
+        Les appels à mark_as_dirty et les émissions de dataset_modified faits
+        dans le bloc sont fusionnés en une seule notification à la sortie.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                dirty, modified = self._bulk_dirty, self._bulk_modified
+                self._bulk_dirty = self._bulk_modified = False
+                if dirty:
+                    # Les statistiques ont été invalidées au fil du lot si nécessaire
+                    self.mark_as_dirty(invalidate_stats=False)
+                if modified and self.dataset:
+                    self._notify_dataset_modified()
+        
+    def _cancel_import(self):
+        """Abandonne l'import en cours: ses résultats ne concernent plus le dataset affiché."""
+        if not self._import_remaining:
+            return
+        
+        self._import_generation += 1
+        self._import_results = []
+        self._import_remaining = 0
+        self.add_images_btn.setEnabled(True)
+        self.show_progress(False)
+            
     def _on_delete_image(self):
         """Supprime l'image sélectionnée."""
-        items = self.image_list.selectedItems()
-        if not items or not self.dataset:
+        indexes = self.image_list.selectionModel().selectedIndexes()
+        if not indexes or not self.dataset:
             return
             
-        image = items[0].data(Qt.ItemDataRole.UserRole)
+        row = indexes[0].row()
+        image = self._image_model.image(row)
         
         if not self.confirm_action(
             "Confirmer la suppression",
@@ -722,22 +1381,25 @@ class DatasetView(BaseView):
         try:
             # Supprimer l'image du dataset
             self.dataset.remove_image(image)
+            self._invalidate_image_paths()
+            self._metadata_html_cache.pop(image.id, None)
             
-            # Mettre à jour l'interface
-            self._update_ui()
+            # Retirer seulement sa ligne: les autres miniatures restent en place
+            self._image_model.remove_row(row)
+            self._adjust_stats(images=-1, annotations=-len(image.annotations))
             
             # Effacer l'image courante si c'était celle-ci
             if self.current_image == image:
                 self.current_image = None
                 self.image_viewer.clear_image()
                 self.image_info_label.setText("")
-                self.annotation_list.clear()
+                self._update_annotations()
             
-            # Marquer le dataset comme modifié
-            self.mark_as_dirty()
+            # Marquer le dataset comme modifié (statistiques déjà ajustées)
+            self.mark_as_dirty(invalidate_stats=False)
             
             # Émettre le signal de modification du dataset
-            self.dataset_modified.emit(self.dataset)
+            self._notify_dataset_modified()
             
         except Exception as e:
             self.logger.error(f"Échec de la suppression de l'image: {str(e)}")
@@ -768,15 +1430,15 @@ class DatasetView(BaseView):
             self.mark_as_dirty()
             
             # Émettre le signal de modification du dataset
-            self.dataset_modified.emit(self.dataset)
+            self._notify_dataset_modified()
             
     def _on_delete_annotation(self):
         """Supprime l'annotation sélectionnée."""
         if not self.current_image:
             return
             
-        items = self.annotation_list.selectedItems()
-        if not items:
+        indexes = self.annotation_list.selectionModel().selectedIndexes()
+        if not indexes:
             return
             
         if not self.confirm_action(
@@ -786,17 +1448,18 @@ class DatasetView(BaseView):
             return
             
         try:
-            index = self.annotation_list.row(items[0])
+            index = indexes[0].row()
             if 0 <= index < len(self.current_image.annotations):
-                del self.current_image.annotations[index]
-                self._update_annotations()
+                # Le modèle partage la liste de l'image: il supprime l'annotation et retire sa ligne
+                self._annotation_model.remove_row(index)
+                self._adjust_stats(annotations=-1)
                 self.image_viewer.set_annotations(self.current_image.annotations)
                 
-                # Marquer le dataset comme modifié
-                self.mark_as_dirty()
+                # Marquer le dataset comme modifié (statistiques déjà ajustées)
+                self.mark_as_dirty(invalidate_stats=False)
                 
                 # Émettre le signal de modification du dataset
-                self.dataset_modified.emit(self.dataset)
+                self._notify_dataset_modified()
                 
         except Exception as e:
             self.logger.error(f"Échec de la suppression de l'annotation: {str(e)}")
@@ -942,10 +1605,11 @@ class DatasetView(BaseView):
             
     def reset_view(self):
         """Réinitialise la vue à son état par défaut."""
+        self._cancel_import()
         self.dataset = None
         self.current_image = None
-        self.image_list.clear()
-        self.annotation_list.clear()
+        self._image_model.set_rows([])
+        self._annotation_model.set_annotations([], {})
         self.image_info_label.setText("")
         self.image_viewer.clear_image()
         self.total_images_label.setText("Total Images: 0")
@@ -987,12 +1651,9 @@ class DatasetView(BaseView):
                     # Restaurer l'image sélectionnée
                     current_image_id = state.get("current_image_id")
                     if current_image_id:
-                        for i in range(self.image_list.count()):
-                            item = self.image_list.item(i)
-                            image = item.data(Qt.ItemDataRole.UserRole)
-                            if image.id == current_image_id:
-                                self.image_list.setCurrentItem(item)
-                                break
+                        row = self._image_model.row_of(current_image_id)
+                        if row is not None:
+                            self.image_list.setCurrentIndex(self._image_model.index(row))
         except Exception as e:
             self.logger.error(f"Échec de la restauration de l'état de la vue: {str(e)}")
             # Ne pas afficher d'erreur à l'utilisateur
@@ -1038,7 +1699,7 @@ class DatasetView(BaseView):
             self.mark_as_dirty()
             
             # Émettre le signal de modification du dataset
-            self.dataset_modified.emit(self.dataset)
+            self._notify_dataset_modified()
         else:
             # Supprimer l'annotation si annulée
             self.current_image.annotations.remove(annotation)
@@ -1055,14 +1716,14 @@ class DatasetView(BaseView):
             return
         
         # L'annotation a déjà été mise à jour dans le visualiseur
-        # Mettre à jour l'affichage des annotations
-        self._update_annotations()
+        # Ne rafraîchir que sa ligne dans la liste
+        self._annotation_model.refresh_row(index)
         
         # Marquer le dataset comme modifié
         self.mark_as_dirty()
         
         # Émettre le signal de modification du dataset
-        self.dataset_modified.emit(self.dataset)
+        self._notify_dataset_modified()
     def _on_language_changed(self, language_code: str):
         """Gestionnaire pour le changement de langue."""
         # Mettre à jour les boutons et labels
@@ -1084,7 +1745,14 @@ class DatasetView(BaseView):
             self.edit_annotation_btn.setText(tr("view.dataset.edit_annotation"))
         if hasattr(self, 'delete_annotation_btn'):
             self.delete_annotation_btn.setText(tr("view.dataset.delete_annotation"))
+        if hasattr(self, '_image_menu'):
+            self._image_menu_edit.setText(tr("view.dataset.edit_annotations"))
+            self._image_menu_delete.setText(tr("view.dataset.delete_image"))
+        if hasattr(self, '_annotation_menu'):
+            self._annotation_menu_edit.setText(tr("view.dataset.edit_mode"))
+            self._annotation_menu_delete.setText(tr("view.dataset.delete_annotation"))
         
         # Mettre à jour les statistiques si elles existent
+        self._load_stats_templates()
         if hasattr(self, 'dataset') and self.dataset:
             self._update_stats()